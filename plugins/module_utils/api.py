@@ -0,0 +1,628 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import base64
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+
+# controller side response cache, can be tuned (or disabled) by environment variables
+CACHE_ENABLED = os.environ.get("BAMBUDDY_CACHE", "true").lower() not in [
+    "0",
+    "false",
+    "no",
+    "off",
+]
+CACHE_DIR = os.environ.get(
+    "BAMBUDDY_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "nils_ost.bambuddy", "responses"),
+)
+# entries without ETag/Last-Modified are served without asking the server for this many seconds
+CACHE_TTL = float(os.environ.get("BAMBUDDY_CACHE_TTL", 5))
+# entries with validators are kept this long, as long as they are revalidated
+CACHE_MAX_AGE = float(os.environ.get("BAMBUDDY_CACHE_MAX_AGE", 86400))
+CACHE_MAX_SIZE = int(float(os.environ.get("BAMBUDDY_CACHE_MAX_MB", 16)) * 1024 * 1024)
+TOKEN_CACHE_DIR = os.environ.get(
+    "BAMBUDDY_TOKEN_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "nils_ost.bambuddy", "tokens"),
+)
+# lifetime of cached tokens, that don't contain an expiry (exp claim)
+TOKEN_CACHE_TTL = float(os.environ.get("BAMBUDDY_TOKEN_CACHE_TTL", 3600))
+FACTS_CACHE_DIR = os.environ.get(
+    "BAMBUDDY_FACTS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "nils_ost.bambuddy", "facts"),
+)
+# facts gathered by module facts are used by the other modules for this many seconds
+FACTS_TTL = float(os.environ.get("BAMBUDDY_FACTS_TTL", 86400))
+# CA certificate(s) to verify https endpoints with, e.g. of a reverse proxy using a private CA
+VERIFY = os.environ.get("BAMBUDDY_CA_BUNDLE") or True
+# controller wide limits per instance, shared by all processes (forks) through lock files, 0 disables a limit
+RATE_LIMIT = float(os.environ.get("BAMBUDDY_RATE_LIMIT", 0))
+RATE_BURST = float(os.environ.get("BAMBUDDY_RATE_BURST", 0)) or max(RATE_LIMIT, 1)
+MAX_IN_FLIGHT = int(os.environ.get("BAMBUDDY_MAX_IN_FLIGHT", 0))
+LIMIT_DIR = os.environ.get(
+    "BAMBUDDY_LIMIT_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "nils_ost.bambuddy", "limits"),
+)
+
+
+def _sha(value):
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def jwt_payload(token):
+    """
+    returns the decoded payload of a JWT, or an empty dict if token isn't a JWT
+    """
+    try:
+        payload = token.split(".")[1]
+        payload = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except Exception:
+        return dict()
+    return payload if isinstance(payload, dict) else dict()
+
+
+def auth_identity(authorization):
+    # tokens are renewed on every login, therefore the user (JWT subject) is used as identity if available
+    if not authorization:
+        return "anonymous"
+    token = authorization.split(" ")[-1]
+    subject = jwt_payload(token).get("sub")
+    if subject:
+        return "user:%s" % subject
+    return "token:%s" % _sha(token)
+
+
+class Limiter:
+    """
+    token bucket (rate) and in-flight slots per instance, coordinated across processes by flock on files in LIMIT_DIR
+    """
+
+    def __init__(self, base_url, rate=None, burst=None, max_in_flight=None, path=None):
+        self.rate = RATE_LIMIT if rate is None else rate
+        self.burst = RATE_BURST if burst is None else burst
+        self.max_in_flight = MAX_IN_FLIGHT if max_in_flight is None else max_in_flight
+        self.path = path or LIMIT_DIR
+        self.key = _sha(base_url.rstrip("/"))[:32]
+
+    @property
+    def enabled(self):
+        return self.rate > 0 or self.max_in_flight > 0
+
+    def _take_token(self):
+        file = os.path.join(self.path, self.key + ".bucket")
+        while True:
+            with open(file, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                f.seek(0)
+                try:
+                    state = json.loads(f.read())
+                except ValueError:
+                    state = dict(tokens=self.burst, updated=time.time())
+                now = time.time()
+                tokens = min(
+                    self.burst,
+                    state["tokens"] + max(now - state["updated"], 0) * self.rate,
+                )
+                wait = 0 if tokens >= 1 else (1 - tokens) / self.rate
+                if wait == 0:
+                    tokens -= 1
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(dict(tokens=tokens, updated=now)))
+                # the lock is released on close, before sleeping
+            if wait == 0:
+                return
+            time.sleep(wait)
+
+    def _take_slot(self):
+        # a slot is a locked file, locks of crashed processes are released by the kernel
+        while True:
+            for i in range(self.max_in_flight):
+                fd = os.open(
+                    os.path.join(self.path, "%s.slot%d" % (self.key, i)),
+                    os.O_CREAT | os.O_RDWR,
+                    0o600,
+                )
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    os.close(fd)
+                    continue
+                return fd
+            time.sleep(0.05)
+
+    @contextmanager
+    def acquire(self):
+        if not self.enabled:
+            yield
+            return
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        slot = self._take_slot() if self.max_in_flight > 0 else None
+        try:
+            if self.rate > 0:
+                self._take_token()
+            yield
+        finally:
+            if slot is not None:
+                os.close(slot)
+
+
+class LimitedSession(requests.Session):
+    """
+    requests.Session applying the Limiter of the instance on every request
+    """
+
+    def __init__(self, base_url, limiter=None):
+        super(LimitedSession, self).__init__()
+        self.limiter = limiter or Limiter(base_url)
+
+    def request(self, method, url, *args, **kwargs):
+        with self.limiter.acquire():
+            return super(LimitedSession, self).request(method, url, *args, **kwargs)
+
+
+class ResponseCache:
+    def __init__(self, base_url, path=None, ttl=None, max_age=None, max_size=None):
+        self.path = path or CACHE_DIR
+        self.ttl = CACHE_TTL if ttl is None else ttl
+        self.max_age = CACHE_MAX_AGE if max_age is None else max_age
+        self.max_size = CACHE_MAX_SIZE if max_size is None else max_size
+        self.instance_dir = os.path.join(self.path, _sha(base_url.rstrip("/"))[:32])
+        # bytes stored since the last eviction, None if the cache wasn't evicted yet
+        self.stored = None
+
+    def _file(self, key):
+        return os.path.join(self.instance_dir, key + ".json")
+
+    def _generation_file(self):
+        return os.path.join(self.instance_dir, "generation")
+
+    def generation(self):
+        """
+        returns the current invalidation generation of the instance, it changes on every invalidate
+        """
+        try:
+            with open(self._generation_file(), "r") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def load(self, key):
+        try:
+            with open(self._file(key), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key, entry, generation=None):
+        """
+        stores entry, unless the cache was invalidated since generation (taken before the request was sent),
+        as the response could then be older than the write that invalidated the cache
+        """
+        if not self.generation() == generation:
+            return
+        # cached responses can contain access codes, therefore they are only readable by the owner
+        os.makedirs(self.instance_dir, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.instance_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+            size = f.tell()
+        os.replace(tmp, self._file(key))
+        # an invalidate running concurrently could have missed the entry
+        if not self.generation() == generation:
+            self._remove(self._file(key))
+            return
+        # walking the whole cache on every store would be quadratic when streaming lists,
+        # therefore it's evicted on the first store and after an eighth of max_size got stored again
+        if self.stored is None or self.stored + size > self.max_size / 8:
+            self.evict()
+            self.stored = 0
+        else:
+            self.stored += size
+
+    def invalidate(self):
+        # any write to an instance invalidates everything cached for it, regardless of the identity,
+        # the generation is changed first, so requests still in flight (in other forks) don't store their responses
+        os.makedirs(self.instance_dir, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.instance_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write("%d-%d" % (time.time_ns(), os.getpid()))
+        os.replace(tmp, self._generation_file())
+        for name in os.listdir(self.instance_dir):
+            if not name.endswith(".json"):
+                continue
+            self._remove(os.path.join(self.instance_dir, name))
+
+    def evict(self):
+        now = time.time()
+        files = list()
+        for root, dirs, names in os.walk(self.path):
+            for name in names:
+                if name == "generation":
+                    continue
+                file = os.path.join(root, name)
+                try:
+                    stat = os.stat(file)
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.max_age:
+                    self._remove(file)
+                else:
+                    files.append((stat.st_mtime, stat.st_size, file))
+        total = sum(f[1] for f in files)
+        for mtime, size, file in sorted(files):
+            if total <= self.max_size:
+                break
+            self._remove(file)
+            total -= size
+
+    def _remove(self, file):
+        try:
+            os.remove(file)
+        except OSError:
+            pass
+
+
+class CachingSession(LimitedSession):
+    """
+    LimitedSession doing conditional GETs (If-None-Match/If-Modified-Since) against the ResponseCache,
+    responses served from the cache don't count against the limits
+    """
+
+    def __init__(self, base_url, cache=None, limiter=None):
+        super(CachingSession, self).__init__(base_url, limiter)
+        self.cache = cache or ResponseCache(base_url)
+
+    def request(self, method, url, *args, **kwargs):
+        if not method.upper() == "GET":
+            try:
+                return super(CachingSession, self).request(method, url, *args, **kwargs)
+            finally:
+                self.cache.invalidate()
+        if args:
+            # only keyword arguments are inspected for the cache key
+            return super(CachingSession, self).request(method, url, *args, **kwargs)
+
+        params = kwargs.get("params") or dict()
+        identity = auth_identity(self.headers.get("Authorization"))
+        key = _sha(
+            "%s %s %s"
+            % (identity, url, json.dumps(params, sort_keys=True, default=str)),
+        )
+        entry = self.cache.load(key)
+        now = time.time()
+
+        if entry is not None:
+            if entry.get("etag") is None and entry.get("last_modified") is None:
+                if now - entry["stored_at"] < self.cache.ttl:
+                    return self._cached_response(entry, url)
+                entry = None
+
+        generation = self.cache.generation()
+        headers = dict(kwargs.pop("headers", None) or dict())
+        if entry is not None:
+            if entry.get("etag") is not None:
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified") is not None:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super(CachingSession, self).request(
+            method, url, headers=headers, **kwargs
+        )
+
+        if response.status_code == 304 and entry is not None:
+            entry["stored_at"] = now
+            self.cache.store(key, entry, generation)
+            return self._cached_response(entry, url)
+
+        if response.status_code == 200 and "json" in response.headers.get(
+            "Content-Type", ""
+        ):
+            self.cache.store(
+                key,
+                dict(
+                    url=url,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    content_type=response.headers.get("Content-Type"),
+                    stored_at=now,
+                    body=response.content.decode("utf-8"),
+                ),
+                generation,
+            )
+        return response
+
+    def _cached_response(self, entry, url):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = url
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": entry.get("content_type") or "application/json"}
+        )
+        response._content = entry["body"].encode("utf-8")
+        response.from_cache = True
+        return response
+
+
+class TokenCache:
+    """
+    tokens of previous logins by URL, user and password, so following tasks don't need to login again
+    """
+
+    def __init__(self, path=None, ttl=None):
+        self.path = path or TOKEN_CACHE_DIR
+        self.ttl = TOKEN_CACHE_TTL if ttl is None else ttl
+
+    def _file(self, url, user, password):
+        return os.path.join(
+            self.path, _sha("%s %s %s" % (url.rstrip("/"), user, password)) + ".json"
+        )
+
+    def load(self, url, user, password):
+        try:
+            with open(self._file(url, user, password), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # a token running out within the next minute is of no use anymore
+        if entry.get("expires", 0) - 60 < time.time():
+            return None
+        return entry.get("token")
+
+    def store(self, url, user, password, token):
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        expires = jwt_payload(token).get("exp") or time.time() + self.ttl
+        # mkstemp creates files only readable by the owner
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(dict(token=token, expires=expires), f)
+        os.replace(tmp, self._file(url, user, password))
+
+    def drop(self, url, user, password):
+        try:
+            os.remove(self._file(url, user, password))
+        except OSError:
+            pass
+
+
+class FactsCache:
+    """
+    facts of the instances, as gathered by module facts, to be used by the other modules without probing again
+    """
+
+    def __init__(self, path=None, ttl=None):
+        self.path = path or FACTS_CACHE_DIR
+        self.ttl = FACTS_TTL if ttl is None else ttl
+
+    def _file(self, url):
+        return os.path.join(self.path, _sha(url.rstrip("/")) + ".json")
+
+    def load(self, url):
+        try:
+            with open(self._file(url), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("stored_at", 0) > self.ttl:
+            return None
+        return entry.get("facts")
+
+    def store(self, url, facts):
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(dict(facts=facts, stored_at=time.time()), f)
+        os.replace(tmp, self._file(url))
+
+
+_facts = dict()
+
+
+def facts(url):
+    """
+    returns the cached facts of the instance (loaded once per process), None if they are unknown or outdated
+    """
+    url = url.rstrip("/")
+    if url not in _facts:
+        _facts[url] = FactsCache().load(url) if CACHE_ENABLED else None
+    return _facts[url]
+
+
+def login(url, user, password):
+    """
+    logs in with user and password and returns the access token
+    """
+    with Limiter(url).acquire():
+        response = requests.post(
+            url + "/api/v1/auth/login",
+            json=dict(username=user, password=password),
+            headers={"Content-Type": "application/json"},
+            verify=VERIFY,
+        )
+    if not response.status_code == 200:
+        raise APIError("error on fetching API token: %s" % response.text, response.text)
+    if "access_token" not in response.json():
+        raise APIError("API response not containing a token")
+    return response.json()["access_token"]
+
+
+def token_valid(url, token):
+    with Limiter(url).acquire():
+        response = requests.get(
+            url + "/api/v1/auth/me",
+            headers={"Authorization": "Bearer %s" % token},
+            verify=VERIFY,
+        )
+    return response.status_code == 200
+
+
+def fetch_token(url, user, password, cache=True):
+    """
+    returns a token for user, a cached one if it's still accepted by the instance, else a new one by login
+    """
+    tokens = TokenCache() if cache and CACHE_ENABLED else None
+    if tokens is not None:
+        token = tokens.load(url, user, password)
+        if token is not None and token_valid(url, token):
+            return token
+        tokens.drop(url, user, password)
+    token = login(url, user, password)
+    if tokens is not None:
+        tokens.store(url, user, password, token)
+    return token
+
+
+def create_session(url, token=None, cache=True, limit=True):
+    """
+    returns a session for url, with limit disabled the rate limit and in-flight limit aren't applied
+    """
+    limiter = None if limit else Limiter(url, rate=0, max_in_flight=0)
+    if cache and CACHE_ENABLED:
+        session = CachingSession(url, limiter=limiter)
+    else:
+        session = LimitedSession(url, limiter=limiter)
+    session.verify = VERIFY
+    session.headers["Content-Type"] = "application/json"
+    if token is not None and not token == "":
+        session.headers["Authorization"] = "Bearer %s" % token
+    return session
+
+
+# list endpoints per target, the flag marks endpoints supporting limit/offset pagination
+ENDPOINTS = dict(
+    printer=("/api/v1/printers/", False),
+    archive=("/api/v1/archives/", True),
+    queue=("/api/v1/queue/", False),
+    library_file=("/api/v1/library/files", False),
+    spool=("/api/v1/inventory/spools", False),
+    smart_plug=("/api/v1/smart-plugs/", False),
+    notification_provider=("/api/v1/notifications/", False),
+)
+
+
+def endpoint(url, target):
+    """
+    returns path and pagination flag of the list endpoint of target,
+    the flag of ENDPOINTS is overridden by the facts of the instance, if known (null if the description
+    of the endpoint lists just one of limit and offset)
+    """
+    path, paged = ENDPOINTS[target]
+    known = ((facts(url) or dict()).get("endpoints") or dict()).get(target) or dict()
+    if known.get("paged") is not None:
+        paged = known["paged"]
+    return path, paged
+
+
+class APIError(Exception):
+    def __init__(self, msg, response=None):
+        super(APIError, self).__init__(msg)
+        self.response = response
+
+
+def _query_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def _filter_matches(value, expected):
+    if isinstance(expected, list):
+        return any(_filter_matches(value, e) for e in expected)
+    if type(value) is type(expected):
+        return value == expected
+    return str(_query_value(value)).lower() == str(_query_value(expected)).lower()
+
+
+def matches(item, filters):
+    for k, v in (filters or dict()).items():
+        if not _filter_matches(item.get(k), v):
+            return False
+    return True
+
+
+def project(item, fields):
+    if not fields:
+        return item
+    return {k: item[k] for k in fields if k in item}
+
+
+def iterate(session, url, target, filters=None, page_size=100, limit=None, paged=None):
+    """
+    yields all items of target, filters are send as query parameters and applied on the result as well,
+    as not every endpoint is able to filter on server side, paged overrides the pagination flag of the endpoint,
+    raises ValueError if a filter isn't a field of target
+    """
+    path, known = endpoint(url, target)
+    paged = known if paged is None else paged
+    # a list of values is only applied on the result, as a query parameter would just match one of them
+    params = {
+        k: _query_value(v)
+        for k, v in (filters or dict()).items()
+        if not isinstance(v, list)
+    }
+    offset = 0
+    count = 0
+    effective = page_size
+    first = None
+    while limit is None or count < limit:
+        if paged:
+            params.update(limit=page_size, offset=offset)
+        response = session.get(url + path, params=params)
+        if not response.status_code == 200:
+            raise APIError("error fetching %s list" % target, response.text)
+        page = response.json()
+        if len(page) == 0:
+            return
+        if offset == 0:
+            first = page[0]
+            unknown = sorted(k for k in (filters or dict()) if k not in first)
+            if unknown:
+                raise ValueError(
+                    "unknown filter field(s) %s for %s" % (", ".join(unknown), target)
+                )
+            # a server capping the page size returns less than requested, this is the page size from then on
+            effective = min(page_size, len(page))
+        elif page[0] == first:
+            # an endpoint ignoring offset returns the first page again
+            return
+        for item in page:
+            if not matches(item, filters):
+                continue
+            yield item
+            count += 1
+            if limit is not None and count >= limit:
+                return
+        # an endpoint ignoring limit/offset returns everything at once
+        if not paged or len(page) < effective or len(page) > page_size:
+            return
+        offset += len(page)
+
+
+def parallel(func, items, workers=4):
+    """
+    calls func for every item with at most workers concurrent calls, results are returned in order of items
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(func, items))
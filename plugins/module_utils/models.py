@@ -0,0 +1,153 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+
+def normalize(value):
+    """
+    normalizes values of API responses and module parameters, so they can be compared
+    (null equals an empty string, floats are compared on 6 decimals)
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+def equal(v1, v2):
+    return normalize(v1) == normalize(v2)
+
+
+class Model:
+    """
+    base of the resource models, the attributes are the FIELDS of the resource,
+    the parsed response is kept as raw to be returned by the modules
+    """
+
+    __slots__ = ("raw",)
+    FIELDS = ()
+
+    def __init__(self, raw):
+        self.raw = raw
+        for field in self.FIELDS:
+            setattr(self, field, raw.get(field))
+
+    @classmethod
+    def from_response(cls, response):
+        # the response body is parsed just once, everything else works on the model
+        return cls(response.json())
+
+    def to_dict(self, fields=None):
+        return {f: getattr(self, f) for f in fields or self.FIELDS}
+
+    def diff(self, desired):
+        """
+        returns the items of desired (dict) with a value different to the current one
+        """
+        return {
+            k: v
+            for k, v in desired.items()
+            if k in self.FIELDS and not equal(getattr(self, k), v)
+        }
+
+    def matches(self, desired):
+        return len(self.diff(desired)) == 0
+
+
+class Printer(Model):
+    FIELDS = (
+        "id",
+        "name",
+        "ip_address",
+        "serial_number",
+        "access_code",
+        "model",
+        "location",
+        "auto_archive",
+    )
+    __slots__ = FIELDS
+
+
+class Settings(Model):
+    FIELDS = (
+        "ams_humidity_good",
+        "ams_humidity_fair",
+        "ams_temp_good",
+        "ams_temp_fair",
+        "auto_archive",
+        "save_thumbnails",
+        "capture_finish_photo",
+        "camera_view_mode",
+        "check_updates",
+        "check_printer_firmware",
+        "currency",
+        "default_filament_cost",
+        "energy_cost_per_kwh",
+        "energy_tracking_mode",
+        "external_url",
+        "ha_enabled",
+        "ha_url",
+        "ha_token",
+        "library_archive_mode",
+        "library_disk_warning_gb",
+        "prometheus_enabled",
+        "prometheus_token",
+    )
+    __slots__ = FIELDS
+
+
+class VirtualPrinterConfig(Model):
+    FIELDS = (
+        "enabled",
+        "access_code",
+        "model",
+        "mode",
+        "target_printer_id",
+        "remote_interface_ip",
+    )
+    __slots__ = FIELDS
+
+
+class Printers:
+    """
+    list of printers indexed by id, name and serial_number
+    """
+
+    __slots__ = ("items", "by_id", "by_name", "by_serial")
+
+    def __init__(self, items):
+        self.items = [i if isinstance(i, Printer) else Printer(i) for i in items]
+        self.by_id = dict()
+        self.by_name = dict()
+        self.by_serial = dict()
+        for printer in self.items:
+            self.by_id[printer.id] = printer
+            self.by_name.setdefault(printer.name, printer)
+            if printer.serial_number:
+                self.by_serial.setdefault(printer.serial_number, printer)
+
+    @classmethod
+    def from_response(cls, response):
+        return cls(response.json())
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, id=None, name=None, serial_number=None):
+        """
+        returns the first printer matching id, serial_number or name (checked in this order), None if none matches
+        """
+        if id is not None and id in self.by_id:
+            return self.by_id[id]
+        if serial_number and serial_number in self.by_serial:
+            return self.by_serial[serial_number]
+        if name is not None:
+            return self.by_name.get(name)
+        return None
@@ -0,0 +1,131 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+
+
+# files created by mkstemp are only readable by the owner, published files get the mode of a plain open() instead,
+# the umask is read once on import, as reading it means setting it (for all threads)
+_umask = os.umask(0o022)
+os.umask(_umask)
+FILE_MODE = 0o666 & ~_umask
+
+
+def file_checksum(path):
+    # sha1 to be comparable with the checksum returned by ansible.builtin.stat or ansible.builtin.copy
+    digest = hashlib.sha1()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class _HashingWriter:
+    def __init__(self, raw):
+        self.raw = raw
+        self.digest = hashlib.sha1()
+
+    def write(self, data):
+        self.digest.update(data)
+        if self.raw is not None:
+            self.raw.write(data)
+        return len(data)
+
+    def flush(self):
+        if self.raw is not None:
+            self.raw.flush()
+
+
+class OutputFile:
+    """
+    streams lines into a (optionally gzip compressed) file on the controller
+
+    the file is written to a temporary file first and only replaces path if the content changed,
+    in check_mode nothing is written but checksum and changed are calculated anyway,
+    the file gets mode (by default according to the umask), which is corrected on existing files as well
+    """
+
+    def __init__(self, path, compress=False, check_mode=False, mode=None):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.compress = compress
+        self.check_mode = check_mode
+        self.mode = FILE_MODE if mode is None else mode
+        self.count = 0
+        self.checksum = None
+        self.changed = False
+        self._tmp = None
+        self._raw = None
+
+    def __enter__(self):
+        if not self.check_mode:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            fd, self._tmp = tempfile.mkstemp(
+                dir=directory, prefix=".%s." % os.path.basename(self.path)
+            )
+            self._raw = os.fdopen(fd, "wb")
+        self._writer = _HashingWriter(self._raw)
+        if self.compress:
+            # fixed mtime and no filename to get reproducible checksums
+            self._stream = gzip.GzipFile(
+                filename="", mode="wb", fileobj=self._writer, mtime=0
+            )
+        else:
+            self._stream = self._writer
+        return self
+
+    def write(self, line):
+        self._stream.write(line.encode("utf-8") + b"\n")
+        self.count += 1
+
+    def write_json(self, item):
+        self.write(json.dumps(item, separators=(",", ":"), sort_keys=True))
+
+    def write_csv(self, values):
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="").writerow(values)
+        self.write(buffer.getvalue())
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.compress:
+            self._stream.close()
+        if self._raw is not None:
+            self._raw.close()
+        if exc_type is not None:
+            self._cleanup()
+            return False
+        self.checksum = self._writer.digest.hexdigest()
+        self.changed = not self.checksum == file_checksum(self.path)
+        if self._tmp is not None:
+            if self.changed:
+                os.chmod(self._tmp, self.mode)
+                os.replace(self._tmp, self.path)
+            else:
+                self._cleanup()
+        try:
+            if (
+                not self.changed
+                and not os.stat(self.path).st_mode & 0o7777 == self.mode
+            ):
+                self.changed = True
+                if not self.check_mode:
+                    os.chmod(self.path, self.mode)
+        except OSError:
+            pass
+        return False
+
+    def _cleanup(self):
+        if self._tmp is not None and os.path.exists(self._tmp):
+            os.remove(self._tmp)
@@ -0,0 +1,129 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import cProfile
+import io
+import os
+import pstats
+import re
+import resource
+import time
+import tracemalloc
+
+from urllib.parse import urlparse
+
+from ansible.module_utils import basic
+
+
+# opt-in profiling of module runs, nothing is done unless BAMBUDDY_PROFILE_DIR is set
+PROFILE_DIR = os.environ.get("BAMBUDDY_PROFILE_DIR")
+PROFILE_MEMORY = os.environ.get("BAMBUDDY_PROFILE_MEMORY", "false").lower() in [
+    "1",
+    "true",
+    "yes",
+    "on",
+]
+# number of functions and allocation sites listed in the summary
+PROFILE_TOP = int(os.environ.get("BAMBUDDY_PROFILE_TOP", 25))
+# the inventory host is unknown to a module, it's passed per task (e.g. "{{ inventory_hostname }}" by the environment keyword)
+PROFILE_HOST = os.environ.get("BAMBUDDY_PROFILE_HOST")
+
+
+def _cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _instance():
+    """
+    returns the instance (netloc of url, or host and port) the module run was executed against, None if unknown
+    """
+    try:
+        # the parameters are already loaded by AnsibleModule, this just returns them
+        params = basic._load_params()
+    except (Exception, SystemExit):
+        return None
+    if params.get("url"):
+        return urlparse(params["url"]).netloc or None
+    if params.get("host"):
+        return "%s:%s" % (params["host"], params.get("port") or 8000)
+    return None
+
+
+def _write_summary(path, name, host, instance, wall, cpu_before, profile, snapshot):
+    with open(path, "w") as f:
+        f.write("module: %s\n" % name)
+        f.write("host: %s\n" % (host or "unknown"))
+        f.write("instance: %s\n" % (instance or "unknown"))
+        f.write("pid: %d\n" % os.getpid())
+        # everything before run_module (python startup, unpacking of the module, imports) only shows up as cpu time
+        f.write("cpu seconds before run_module: %.3f\n" % cpu_before)
+        f.write("wall seconds of run_module: %.3f\n\n" % wall)
+
+        out = io.StringIO()
+        stats = pstats.Stats(profile, stream=out)
+        stats.sort_stats("cumulative").print_stats(PROFILE_TOP)
+        f.write(out.getvalue())
+
+        if snapshot is not None:
+            f.write("\ntop %d allocations (by line):\n" % PROFILE_TOP)
+            for stat in snapshot.statistics("lineno")[:PROFILE_TOP]:
+                f.write("%s\n" % stat)
+
+
+def run(func, name):
+    """
+    calls func (the run_module of a module) and profiles it if BAMBUDDY_PROFILE_DIR is set,
+    <dir>/<name>_<host>_<timestamp>_<pid>.pstats and .txt (summary) are written, even if func exits the process,
+    host is BAMBUDDY_PROFILE_HOST, or the instance the module was executed against if it isn't set
+    """
+    if not PROFILE_DIR:
+        return func()
+
+    cpu_before = _cpu_seconds()
+    if PROFILE_MEMORY:
+        tracemalloc.start()
+    profile = cProfile.Profile()
+    started = time.monotonic()
+    profile.enable()
+    try:
+        # exit_json and fail_json end the module by sys.exit, therefore the results are written in finally
+        return func()
+    finally:
+        profile.disable()
+        wall = time.monotonic() - started
+        snapshot = None
+        if PROFILE_MEMORY:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+        instance = _instance()
+        host = PROFILE_HOST or instance
+        try:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            base = os.path.join(
+                PROFILE_DIR,
+                "%s_%s_%s_%d"
+                % (
+                    name,
+                    re.sub(r"[^A-Za-z0-9.-]", "-", host or "unknown"),
+                    time.strftime("%Y%m%dT%H%M%S"),
+                    os.getpid(),
+                ),
+            )
+            profile.dump_stats(base + ".pstats")
+            _write_summary(
+                base + ".txt",
+                name,
+                host,
+                instance,
+                wall,
+                cpu_before,
+                profile,
+                snapshot,
+            )
+        except OSError:
+            # profiling must never break a module run
+            pass
@@ -0,0 +1,143 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import re
+
+from fnmatch import fnmatchcase
+
+
+MATCHER = re.compile(
+    r'^\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*(=~|!~|!=|=)\s*"((?:[^"\\]|\\.)*)"\s*$'
+)
+SUFFIXES = ["_bucket", "_sum", "_count", "_total", "_created", "_info"]
+ESCAPES = {"\\": "\\", '"': '"', "n": "\n"}
+
+
+def _unescape(value):
+    return re.sub(r"\\(.)", lambda m: ESCAPES.get(m.group(1), m.group(1)), value)
+
+
+def parse_matchers(matchers):
+    """
+    parses PromQL like label matchers (e.g. printer=~"X1.*") into (label, operator, value) tuples
+    """
+    parsed = list()
+    for matcher in matchers or list():
+        m = MATCHER.match(matcher)
+        if m is None:
+            raise ValueError(f"invalid label matcher: {matcher}")
+        label, op, value = m.group(1), m.group(2), _unescape(m.group(3))
+        if op in ["=~", "!~"]:
+            value = re.compile("^(?:%s)$" % value)
+        parsed.append((label, op, value))
+    return parsed
+
+
+def labels_match(labels, matchers):
+    for label, op, value in matchers:
+        current = labels.get(label, "")
+        if op == "=" and not current == value:
+            return False
+        if op == "!=" and current == value:
+            return False
+        if op == "=~" and value.match(current) is None:
+            return False
+        if op == "!~" and value.match(current) is not None:
+            return False
+    return True
+
+
+def parse_sample(line):
+    """
+    parses one sample line of the text exposition format into (name, labels, value)
+    """
+    brace = line.find("{")
+    space = line.find(" ")
+    if brace == -1 or (space != -1 and space < brace):
+        name, rest = line.split(None, 1)
+        labels = dict()
+    else:
+        name = line[:brace].strip()
+        labels = dict()
+        i = brace + 1
+        while True:
+            while line[i] in " ,":
+                i += 1
+            if line[i] == "}":
+                i += 1
+                break
+            eq = line.index("=", i)
+            label = line[i:eq].strip()
+            i = line.index('"', eq) + 1
+            value = list()
+            while not line[i] == '"':
+                if line[i] == "\\":
+                    value.append(ESCAPES.get(line[i + 1], line[i + 1]))
+                    i += 2
+                else:
+                    value.append(line[i])
+                    i += 1
+            labels[label] = "".join(value)
+            i += 1
+        rest = line[i:]
+    return (name, labels, float(rest.split()[0]))
+
+
+def _family_of(name, types):
+    if name in types:
+        return name
+    for suffix in SUFFIXES:
+        if name.endswith(suffix) and name[: -len(suffix)] in types:
+            return name[: -len(suffix)]
+    return name
+
+
+def parse(lines, families=None, matchers=None):
+    """
+    parses the text exposition format line by line, only families (fnmatch patterns) and samples matching
+    all matchers are kept, everything else is dropped right away
+
+    returns a dict of family name to dict(type, help, samples)
+    """
+    matchers = parse_matchers(matchers)
+    types = dict()
+    helps = dict()
+    result = dict()
+
+    def wanted(family):
+        return not families or any(fnmatchcase(family, f) for f in families)
+
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if line == "":
+            continue
+        if line.startswith("#"):
+            parts = line.split(None, 3)
+            if len(parts) >= 3 and parts[1] == "TYPE":
+                types[parts[2]] = parts[3] if len(parts) > 3 else "untyped"
+            elif len(parts) >= 3 and parts[1] == "HELP":
+                helps[parts[2]] = _unescape(parts[3]) if len(parts) > 3 else ""
+            continue
+        name = line.split("{", 1)[0].split(None, 1)[0]
+        family = _family_of(name, types)
+        if not wanted(family):
+            continue
+        name, labels, value = parse_sample(line)
+        if not labels_match(labels, matchers):
+            continue
+        if family not in result:
+            result[family] = dict(
+                type=types.get(family, "untyped"),
+                help=helps.get(family, ""),
+                samples=list(),
+            )
+        sample = dict(labels=labels, value=value)
+        if not name == family:
+            sample["name"] = name
+        result[family]["samples"].append(sample)
+    return result
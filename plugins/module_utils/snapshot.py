@@ -0,0 +1,73 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import gzip
+import json
+
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, models
+
+
+# version of the snapshot file, increased on incompatible changes
+FORMAT = 1
+SECTIONS = [
+    "settings",
+    "printers",
+    "virtual_printer",
+    "smart_plugs",
+    "notification_providers",
+]
+# sections being plain lists, with the target (see api.ENDPOINTS) they are read from
+LISTS = dict(
+    smart_plugs="smart_plug",
+    notification_providers="notification_provider",
+)
+# fields set by the server, they are neither exported nor compared
+READ_ONLY = ("id", "created_at", "updated_at")
+SETTINGS_ENDPOINT = "/api/v1/settings/"
+VIRTUAL_PRINTER_ENDPOINT = "/api/v1/settings/virtual-printer"
+
+
+def present(model):
+    """
+    returns the fields of model contained in the response, so fields unknown to the instance aren't set to null
+    """
+    return model.to_dict([f for f in model.FIELDS if f in model.raw])
+
+
+def fetch(session, url, sections):
+    """
+    returns the current configuration of the instance for sections,
+    printers are always fetched as other sections refer to them, raises api.APIError on errors
+    """
+    current = dict(printers=models.Printers(api.iterate(session, url, "printer")))
+    if "settings" in sections:
+        response = session.get(url + SETTINGS_ENDPOINT)
+        if not response.status_code == 200:
+            raise api.APIError("error fetching settings", response.text)
+        current["settings"] = models.Settings.from_response(response)
+    if "virtual_printer" in sections:
+        response = session.get(url + VIRTUAL_PRINTER_ENDPOINT)
+        if not response.status_code == 200:
+            raise api.APIError("error fetching virtual_printer settings", response.text)
+        current["virtual_printer"] = models.VirtualPrinterConfig.from_response(response)
+    for section, target in LISTS.items():
+        if section in sections:
+            current[section] = list(api.iterate(session, url, target))
+    return current
+
+
+def read(path):
+    """
+    returns the snapshot in path (gzip compressed or not), raises ValueError if it isn't a snapshot of a supported format
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    snapshot = json.loads(data.decode("utf-8"))
+    if not isinstance(snapshot, dict) or not snapshot.get("format") == FORMAT:
+        raise ValueError(f"{path} is not a snapshot of format {FORMAT}")
+    return snapshot
@@ -0,0 +1,301 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import hashlib
+import json
+import os
+import re
+import time
+
+
+# hashes of inputs that passed validation are remembered here, so unchanged input isn't validated again
+CACHE_DIR = os.environ.get(
+    "BAMBUDDY_VALIDATION_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "nils_ost.bambuddy", "validation"),
+)
+# remembered hashes are used this many seconds, at most this many are kept (the oldest are evicted)
+CACHE_MAX_AGE = float(os.environ.get("BAMBUDDY_VALIDATION_CACHE_MAX_AGE", 2592000))
+CACHE_MAX_ENTRIES = int(os.environ.get("BAMBUDDY_VALIDATION_CACHE_MAX_ENTRIES", 1000))
+
+TYPES = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+# keywords without influence on validation
+ANNOTATIONS = [
+    "$schema",
+    "$id",
+    "title",
+    "description",
+    "default",
+    "examples",
+    "$comment",
+]
+
+
+class SchemaError(Exception):
+    pass
+
+
+def _sha(value):
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _dump(value):
+    return json.dumps(value, default=str)
+
+
+def _join(path, key):
+    if isinstance(key, int):
+        return "%s[%d]" % (path, key)
+    return "%s.%s" % (path, key) if path else str(key)
+
+
+def _compile(schema, location="(root)"):
+    """
+    turns a schema (subset of JSON Schema) into a list of checks, each check is called with
+    (value, path, errors) and appends (path, message) tuples to errors
+    """
+    if schema is True or schema == dict():
+        return list()
+    if schema is False:
+        return [lambda v, p, e: e.append((p, "no value allowed here"))]
+    if not isinstance(schema, dict):
+        raise SchemaError("%s: schema needs to be an object" % location)
+
+    checks = list()
+    schema = dict(schema)
+    for keyword in ANNOTATIONS:
+        schema.pop(keyword, None)
+
+    if "type" in schema:
+        types = schema.pop("type")
+        types = types if isinstance(types, list) else [types]
+        for t in types:
+            if t not in TYPES:
+                raise SchemaError("%s: unknown type %s" % (location, t))
+        funcs = [TYPES[t] for t in types]
+        expected = " or ".join(types)
+
+        def check_type(v, p, e):
+            if not any(f(v) for f in funcs):
+                e.append((p, "%s is not of type %s" % (_dump(v), expected)))
+                return False
+            return True
+
+        # type mismatches would only cause confusing follow-up errors, therefore all other checks are skipped
+        type_check = check_type
+    else:
+        type_check = None
+
+    if "enum" in schema:
+        enum = schema.pop("enum")
+
+        def check_enum(v, p, e):
+            if v not in enum:
+                e.append((p, "%s is not one of %s" % (_dump(v), _dump(enum))))
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        const = schema.pop("const")
+
+        def check_const(v, p, e):
+            if not v == const:
+                e.append((p, "%s is not %s" % (_dump(v), _dump(const))))
+
+        checks.append(check_const)
+
+    def _number(keyword, fails, text):
+        if keyword not in schema:
+            return
+        limit = schema.pop(keyword)
+
+        def check(v, p, e):
+            if TYPES["number"](v) and fails(v, limit):
+                e.append((p, "%s is %s %s" % (v, text, limit)))
+
+        checks.append(check)
+
+    _number("minimum", lambda v, m: v < m, "less than the minimum of")
+    _number("maximum", lambda v, m: v > m, "greater than the maximum of")
+    _number(
+        "exclusiveMinimum", lambda v, m: v <= m, "less than or equal to the minimum of"
+    )
+    _number(
+        "exclusiveMaximum",
+        lambda v, m: v >= m,
+        "greater than or equal to the maximum of",
+    )
+
+    def _length(keyword, applies, fails, text):
+        if keyword not in schema:
+            return
+        limit = schema.pop(keyword)
+
+        def check(v, p, e):
+            if applies(v) and fails(len(v), limit):
+                e.append((p, "%s %s %d" % (_dump(v), text, limit)))
+
+        checks.append(check)
+
+    _length("minLength", TYPES["string"], lambda n, m: n < m, "is shorter than")
+    _length("maxLength", TYPES["string"], lambda n, m: n > m, "is longer than")
+    _length("minItems", TYPES["array"], lambda n, m: n < m, "has less items than")
+    _length("maxItems", TYPES["array"], lambda n, m: n > m, "has more items than")
+
+    if "pattern" in schema:
+        pattern = re.compile(schema.pop("pattern"))
+
+        def check_pattern(v, p, e):
+            if TYPES["string"](v) and pattern.search(v) is None:
+                e.append(
+                    (p, "%s does not match %s" % (_dump(v), _dump(pattern.pattern)))
+                )
+
+        checks.append(check_pattern)
+
+    if "required" in schema:
+        required = schema.pop("required")
+
+        def check_required(v, p, e):
+            if TYPES["object"](v):
+                for key in required:
+                    if key not in v:
+                        e.append((p, "%s is a required property" % _dump(key)))
+
+        checks.append(check_required)
+
+    properties = {
+        k: _compile(s, _join(location, k))
+        for k, s in schema.pop("properties", dict()).items()
+    }
+    patterns = [
+        (re.compile(k), _compile(s, _join(location, k)))
+        for k, s in schema.pop("patternProperties", dict()).items()
+    ]
+    additional = schema.pop("additionalProperties", True)
+    if isinstance(additional, dict):
+        additional = _compile(additional, _join(location, "additionalProperties"))
+    if properties or patterns or additional is not True:
+
+        def check_properties(v, p, e):
+            if not TYPES["object"](v):
+                return
+            for key, value in v.items():
+                path = _join(p, key)
+                matched = False
+                if key in properties:
+                    matched = True
+                    _run(properties[key], value, path, e)
+                for pattern, sub in patterns:
+                    if pattern.search(key) is not None:
+                        matched = True
+                        _run(sub, value, path, e)
+                if matched or additional is True:
+                    continue
+                if additional is False:
+                    e.append((p, "additional property %s is not allowed" % _dump(key)))
+                else:
+                    _run(additional, value, path, e)
+
+        checks.append(check_properties)
+
+    if "items" in schema:
+        items = _compile(schema.pop("items"), _join(location, "items"))
+
+        def check_items(v, p, e):
+            if TYPES["array"](v):
+                for i, item in enumerate(v):
+                    _run(items, item, _join(p, i), e)
+
+        checks.append(check_items)
+
+    if schema:
+        raise SchemaError(
+            "%s: unsupported keywords %s" % (location, ", ".join(sorted(schema.keys())))
+        )
+
+    if type_check is not None:
+        return [type_check] + checks
+    return checks
+
+
+def _run(checks, value, path, errors):
+    for check in checks:
+        # only the type check returns something, if it fails the value is not checked any further
+        if check(value, path, errors) is False:
+            return
+
+
+def load_schema(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def validate(data, schema, name=None):
+    """
+    validates data against schema and returns all errors as list of dict(path, msg), an empty list means valid
+    """
+    errors = list()
+    _run(_compile(schema), data, name or "", errors)
+    return [dict(path=p or "(root)", msg=m) for p, m in errors]
+
+
+class ValidationCache:
+    """
+    remembers the hashes of (schema, data) combinations, that passed validation before
+    """
+
+    def __init__(self, path=None, max_age=None, max_entries=None):
+        self.path = path or CACHE_DIR
+        self.max_age = CACHE_MAX_AGE if max_age is None else max_age
+        self.max_entries = CACHE_MAX_ENTRIES if max_entries is None else max_entries
+
+    def _file(self, schema, data):
+        return os.path.join(self.path, _sha([_sha(schema), _sha(data)]))
+
+    def __contains__(self, item):
+        try:
+            return time.time() - os.stat(self._file(*item)).st_mtime <= self.max_age
+        except OSError:
+            return False
+
+    def add(self, schema, data):
+        # only hashes are stored, so the cache doesn't leak any secrets contained in data
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        with open(self._file(schema, data), "w"):
+            pass
+        self.evict()
+
+    def evict(self):
+        now = time.time()
+        files = list()
+        for name in os.listdir(self.path):
+            file = os.path.join(self.path, name)
+            try:
+                mtime = os.stat(file).st_mtime
+            except OSError:
+                continue
+            if now - mtime > self.max_age:
+                self._remove(file)
+            else:
+                files.append((mtime, file))
+        for mtime, file in sorted(files)[: max(len(files) - self.max_entries, 0)]:
+            self._remove(file)
+
+    def _remove(self, file):
+        try:
+            os.remove(file)
+        except OSError:
+            pass
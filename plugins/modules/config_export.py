@@ -0,0 +1,211 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    api,
+    models,
+    output,
+    profiling,
+    snapshot,
+)
+
+
+DOCUMENTATION = r"""
+---
+module: config_export
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: export the configuration of an instance into a snapshot file
+
+description:
+    - Exports settings, printers, virtual_printer configuration, smart plugs and notification providers of an instance
+      into a single versioned snapshot file on the controller, which can be applied to another instance by module nils_ost.bambuddy.config_import
+    - References to printers (e.g. the target printer of virtual_printer) are exported by the printer name, as ids differ between instances
+    - The snapshot doesn't contain a timestamp, so it is only replaced if the configuration changed
+    - The snapshot contains secrets (access codes and tokens), it is only readable by the owner
+    - The access code of virtual_printer isn't returned by the API and therefore not exported,
+      it has to be given to nils_ost.bambuddy.config_import by virtual_printer_access_code
+    - Needs to be executed on the controller (delegate_to localhost)
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    dest:
+        description:
+            - snapshot file (on the controller)
+        required: true
+        type: path
+    sections:
+        description:
+            - parts of the configuration to be exported
+        required: false
+        type: list
+        elements: str
+        choices: ["settings", "printers", "virtual_printer", "smart_plugs", "notification_providers"]
+        default: ["settings", "printers", "virtual_printer", "smart_plugs", "notification_providers"]
+    compress:
+        description:
+            - gzip compress the snapshot
+        required: false
+        type: bool
+        default: true
+"""
+
+EXAMPLES = r"""
+- name: export configuration
+  nils_ost.bambuddy.config_export:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    dest: "/srv/backup/{{ inventory_hostname }}.bambuddy.json.gz"
+  delegate_to: localhost
+"""
+
+RETURN = r"""
+path:
+    description:
+        - absolute path of the snapshot
+    type: str
+    returned: always
+checksum:
+    description:
+        - sha1 checksum of the snapshot, comparable with the checksum of ansible.builtin.stat
+    type: str
+    returned: always
+counts:
+    description:
+        - number of exported items per section (1 for settings and virtual_printer)
+    type: dict
+    returned: always
+    sample: {"settings": 1, "printers": 12, "virtual_printer": 1, "smart_plugs": 4, "notification_providers": 2}
+"""
+
+
+def export_item(item, names):
+    """
+    returns item without the fields set by the server and with printer_id replaced by printer_name
+    """
+    item = {k: v for k, v in item.items() if k not in snapshot.READ_ONLY}
+    if "printer_id" in item:
+        item["printer_name"] = names.get(item.pop("printer_id"))
+    return item
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        dest=dict(type="path", required=True),
+        sections=dict(
+            type="list",
+            elements="str",
+            required=False,
+            default=list(snapshot.SECTIONS),
+            choices=snapshot.SECTIONS,
+        ),
+        compress=dict(type="bool", required=False, default=True),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        path=None,
+        checksum=None,
+        counts=dict(),
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    try:
+        url = module.params["url"].rstrip("/")
+        sections = module.params["sections"]
+
+        s = api.create_session(url, module.params["token"])
+        try:
+            current = snapshot.fetch(s, url, sections)
+        except api.APIError as e:
+            module.fail_json(msg=str(e), response=e.response, **result)
+
+        names = {p.id: p.name for p in current["printers"]}
+        data = dict(
+            format=snapshot.FORMAT,
+            source=url,
+            version=(api.facts(url) or dict()).get("version"),
+        )
+        if "settings" in sections:
+            data["settings"] = snapshot.present(current["settings"])
+        if "printers" in sections:
+            fields = [f for f in models.Printer.FIELDS if f not in snapshot.READ_ONLY]
+            data["printers"] = sorted(
+                (p.to_dict(fields) for p in current["printers"]),
+                key=lambda p: p["name"],
+            )
+        if "virtual_printer" in sections:
+            data["virtual_printer"] = snapshot.present(current["virtual_printer"])
+            target = data["virtual_printer"].pop("target_printer_id", None)
+            data["virtual_printer"]["target_printer_name"] = names.get(target)
+        for section in snapshot.LISTS.keys():
+            if section in sections:
+                data[section] = sorted(
+                    (export_item(i, names) for i in current[section]),
+                    key=lambda i: str(i.get("name")),
+                )
+        for section in sections:
+            result["counts"][section] = (
+                len(data[section]) if isinstance(data[section], list) else 1
+            )
+
+        # the whole snapshot is a single JSON document (with sorted keys), so unchanged configuration results in an unchanged file
+        with output.OutputFile(
+            module.params["dest"],
+            compress=module.params["compress"],
+            check_mode=module.check_mode,
+            mode=0o600,
+        ) as out:
+            out.write_json(data)
+        result["path"] = out.path
+        result["checksum"] = out.checksum
+        result["changed"] = out.changed
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "config_export")
+
+
+if __name__ == "__main__":
+    main()
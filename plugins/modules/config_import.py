@@ -0,0 +1,336 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    api,
+    models,
+    profiling,
+    snapshot,
+)
+
+
+DOCUMENTATION = r"""
+---
+module: config_import
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: apply a snapshot file to an instance
+
+description:
+    - Applies a snapshot, as written by module nils_ost.bambuddy.config_export, to an instance, e.g. to migrate a site or to set up a warm spare
+    - The snapshot is compared with the current configuration of the instance and only the differences are applied,
+      the changes of a section are executed concurrently
+    - Printers are matched by serial_number first and by name second, smart plugs and notification providers by name
+    - References to printers are resolved by the printer name, after the printers are applied
+    - An external_url of the settings pointing to the exported instance is pointed to the target instance
+    - The access code of virtual_printer isn't returned by the API, so it isn't contained in snapshots,
+      if the snapshot has virtual_printer enabled, virtual_printer_access_code is required
+    - Needs to be executed on the controller (delegate_to localhost)
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    src:
+        description:
+            - snapshot file (on the controller), gzip compressed or not
+        required: true
+        type: path
+    sections:
+        description:
+            - parts of the snapshot to be applied, sections missing in the snapshot are ignored
+        required: false
+        type: list
+        elements: str
+        choices: ["settings", "printers", "virtual_printer", "smart_plugs", "notification_providers"]
+        default: ["settings", "printers", "virtual_printer", "smart_plugs", "notification_providers"]
+    purge:
+        description:
+            - delete printers, smart plugs and notification providers of the instance, that are not contained in the snapshot
+        required: false
+        type: bool
+        default: false
+    virtual_printer_access_code:
+        description:
+            - access code (as configured in the slicers) set on enabling virtual_printer
+            - required if the virtual_printer section is applied and enabled in the snapshot, as the snapshot doesn't contain the access code
+        required: false
+        type: str
+        default: null
+    workers:
+        description:
+            - maximum number of concurrent requests
+        required: false
+        type: int
+        default: 4
+"""
+
+EXAMPLES = r"""
+- name: clone configuration to the spare instance
+  nils_ost.bambuddy.config_import:
+    url: "{{ bambuddy_spare.url }}"
+    token: "{{ bambuddy_spare.token }}"
+    src: "/srv/backup/{{ inventory_hostname }}.bambuddy.json.gz"
+    purge: true
+    virtual_printer_access_code: "{{ bambuddy_virtual_printer.accesscode }}"
+  delegate_to: localhost
+"""
+
+RETURN = r"""
+changes:
+    description:
+        - the (to be) applied changes per section
+        - names of created, updated and deleted items for printers, smart_plugs and notification_providers
+        - names of the changed settings for settings
+        - true if the configuration changed for virtual_printer
+    type: dict
+    returned: always
+    sample: {"settings": ["currency"], "printers": {"created": ["printer3"], "updated": ["printer1"], "deleted": []},
+             "virtual_printer": false, "smart_plugs": {"created": [], "updated": [], "deleted": []}}
+"""
+
+# the fields of the virtual_printer configuration compared, the access code isn't returned by the API
+VIRTUAL_PRINTER_COMPARED = ("target_printer_id", "mode", "model", "remote_interface_ip")
+
+
+def plan_list(current, desired, purge, ids):
+    """
+    returns jobs (action, name, id, data) to get from the current items to the desired ones, matched by name
+    """
+    by_name = {item.get("name"): item for item in current}
+    jobs = list()
+    for item in desired:
+        item = dict(item)
+        if "printer_name" in item:
+            item["printer_id"] = ids.get(item.pop("printer_name"))
+        existing = by_name.pop(item.get("name"), None)
+        if existing is None:
+            jobs.append(("create", item.get("name"), None, item))
+            continue
+        diff = {k: v for k, v in item.items() if not models.equal(existing.get(k), v)}
+        if diff:
+            jobs.append(("update", item.get("name"), existing["id"], diff))
+    if purge:
+        jobs.extend(("delete", i.get("name"), i["id"], None) for i in by_name.values())
+    return jobs
+
+
+def plan_printers(current, desired, purge):
+    jobs = list()
+    matched = set()
+    for item in desired:
+        existing = current.get(
+            serial_number=item.get("serial_number"), name=item["name"]
+        )
+        if existing is None:
+            jobs.append(("create", item["name"], None, item))
+            continue
+        matched.add(existing.id)
+        if not existing.matches(item):
+            jobs.append(("update", item["name"], existing.id, item))
+    if purge:
+        jobs.extend(
+            ("delete", p.name, p.id, None) for p in current if p.id not in matched
+        )
+    return jobs
+
+
+def summary(jobs):
+    changes = dict(created=list(), updated=list(), deleted=list())
+    for action, name, item_id, data in jobs:
+        changes[action + "d"].append(name)
+    return changes
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        src=dict(type="path", required=True),
+        sections=dict(
+            type="list",
+            elements="str",
+            required=False,
+            default=list(snapshot.SECTIONS),
+            choices=snapshot.SECTIONS,
+        ),
+        purge=dict(type="bool", required=False, default=False),
+        virtual_printer_access_code=dict(
+            type="str", required=False, default=None, no_log=True
+        ),
+        workers=dict(type="int", required=False, default=4),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        changes=dict(),
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    try:
+        url = module.params["url"].rstrip("/")
+        workers = module.params["workers"]
+        if workers < 1:
+            module.fail_json(msg="'workers' needs to be at least 1", **result)
+        try:
+            data = snapshot.read(module.params["src"])
+        except (OSError, ValueError) as e:
+            module.fail_json(msg=f"error on reading snapshot: {e}", **result)
+        sections = [s for s in module.params["sections"] if s in data]
+        access_code = module.params["virtual_printer_access_code"] or data.get(
+            "virtual_printer", dict()
+        ).get("access_code")
+        # checked before anything is applied, enabling virtual_printer without access code would lock out the slicers
+        if (
+            "virtual_printer" in sections
+            and data["virtual_printer"].get("enabled")
+            and not access_code
+        ):
+            module.fail_json(
+                msg="'virtual_printer_access_code' is required, as virtual_printer is enabled in the snapshot, "
+                + "but the snapshot doesn't contain the access code",
+                **result,
+            )
+
+        s = api.create_session(url, module.params["token"])
+        try:
+            current = snapshot.fetch(s, url, sections)
+        except api.APIError as e:
+            module.fail_json(msg=str(e), response=e.response, **result)
+
+        def execute(path, jobs):
+            def apply(job):
+                action, name, item_id, item = job
+                item_url = url + path.rstrip("/") + "/%s" % item_id
+                if action == "create":
+                    response = s.post(url + path, json=item)
+                elif action == "update":
+                    response = s.patch(item_url, json=item)
+                else:
+                    response = s.delete(item_url)
+                    # already gone is fine as well
+                    if response.status_code == 404:
+                        return None
+                if response.status_code not in [200, 201, 204]:
+                    return f"error on {action[:-1]}ing {name}: {response.text}"
+                return None
+
+            if module.check_mode:
+                return
+            errors = [e for e in api.parallel(apply, jobs, workers) if e is not None]
+            if len(errors) > 0:
+                module.fail_json(
+                    msg="error on applying snapshot", errors=errors, **result
+                )
+
+        if "settings" in sections:
+            desired = dict(data["settings"])
+            # an external_url pointing to the exported instance is pointed to this one
+            if (desired.get("external_url") or "").rstrip("/") == data.get("source"):
+                desired["external_url"] = url
+            diff = current["settings"].diff(desired)
+            result["changes"]["settings"] = sorted(diff.keys())
+            if diff and not module.check_mode:
+                response = s.put(
+                    url + snapshot.SETTINGS_ENDPOINT,
+                    json=dict(snapshot.present(current["settings"]), **desired),
+                )
+                if not response.status_code == 200:
+                    module.fail_json(
+                        msg="error configuring settings",
+                        response=response.text,
+                        **result,
+                    )
+
+        printers = current["printers"]
+        if "printers" in sections:
+            jobs = plan_printers(printers, data["printers"], module.params["purge"])
+            result["changes"]["printers"] = summary(jobs)
+            execute(api.ENDPOINTS["printer"][0], jobs)
+            if jobs and not module.check_mode:
+                # the ids of created printers are needed to resolve references
+                printers = models.Printers(api.iterate(s, url, "printer"))
+        ids = {p.name: p.id for p in printers}
+
+        if "virtual_printer" in sections:
+            desired = dict(data["virtual_printer"])
+            name = desired.pop("target_printer_name", None)
+            desired["target_printer_id"] = ids.get(name) if name else None
+            compared = ["enabled"]
+            if desired.get("enabled"):
+                compared.extend(VIRTUAL_PRINTER_COMPARED)
+            changed = not current["virtual_printer"].matches(
+                {k: desired.get(k) for k in compared}
+            )
+            result["changes"]["virtual_printer"] = changed
+            if changed and not module.check_mode:
+                if desired.get("enabled"):
+                    params = dict(desired, access_code=access_code)
+                else:
+                    params = dict(enabled=False)
+                response = s.put(url + snapshot.VIRTUAL_PRINTER_ENDPOINT, params=params)
+                if not response.status_code == 200:
+                    module.fail_json(
+                        msg="error setting virtual_printer configuration",
+                        response=response.text,
+                        **result,
+                    )
+
+        for section, target in snapshot.LISTS.items():
+            if section in sections:
+                jobs = plan_list(
+                    current[section], data[section], module.params["purge"], ids
+                )
+                result["changes"][section] = summary(jobs)
+                execute(api.ENDPOINTS[target][0], jobs)
+
+        for changes in result["changes"].values():
+            if isinstance(changes, dict):
+                changes = [n for names in changes.values() for n in names]
+            result["changed"] = result["changed"] or bool(changes)
+
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "config_import")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import re
+
+from datetime import datetime, timezone
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, profiling
+
+
+DOCUMENTATION = r"""
+---
+module: facts
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: gather facts about a BamBuddy instance
+
+description:
+    - Gathers version, authentication mode, number of printers and (on request) archives, and the available endpoints and features of an instance
+    - Version, endpoints and features are read from the OpenAPI description of the instance, with a single request
+    - The facts are returned as ansible_facts (bambuddy_facts), so they can be kept by the fact cache of Ansible
+    - Additionally the facts are stored on the controller (C(~/.cache/nils_ost.bambuddy/facts) or C(BAMBUDDY_FACTS_CACHE_DIR)),
+      where the other modules of this collection read them, e.g. to use a paged or a bulk request for lists, without probing again
+    - Needs to be executed on the controller (delegate_to localhost)
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    gather_subset:
+        description:
+            - which facts are gathered, one or more of all, api (version, endpoints and features), auth, printers and archives
+            - a subset prefixed with ! is not gathered, e.g. C(["all", "!auth"])
+            - all doesn't contain archives, as the API doesn't return a total and counting requires to page through all archives,
+              it has to be requested explicitly, e.g. C(["all", "archives"])
+        required: false
+        type: list
+        elements: str
+        default: ["all"]
+    openapi_path:
+        description:
+            - path of the OpenAPI description of the instance
+        required: false
+        type: str
+        default: "/openapi.json"
+    page_size:
+        description:
+            - number of archives fetched per request on counting them
+        required: false
+        type: int
+        default: 500
+    cache:
+        description:
+            - store the facts on the controller, to be used by the other modules
+        required: false
+        type: bool
+        default: true
+"""
+
+EXAMPLES = r"""
+- name: gather BamBuddy facts
+  nils_ost.bambuddy.facts:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+  delegate_to: localhost
+
+- name: show version
+  ansible.builtin.debug:
+    msg: "BamBuddy {{ bambuddy_facts.version }} with {{ bambuddy_facts.printers }} printers"
+
+# count the archives as well, this pages through all of them
+- name: gather BamBuddy facts
+  nils_ost.bambuddy.facts:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    gather_subset:
+      - all
+      - archives
+  delegate_to: localhost
+"""
+
+RETURN = r"""
+ansible_facts:
+    description:
+        - facts of the instance
+    type: dict
+    returned: always
+    contains:
+        bambuddy_facts:
+            description:
+                - the gathered facts, subsets not gathered are missing
+                - values of the api subset are null, if the instance doesn't serve an OpenAPI description
+            type: dict
+            sample: {"url": "http://bambuddy:8000", "gathered_at": "2026-10-19T08:12:31+00:00", "version": "0.2.0",
+                     "auth": {"enabled": true, "requires_setup": false}, "printers": 12, "archives": 4711,
+                     "endpoints": {"archive": {"path": "/api/v1/archives/", "available": true, "paged": true}},
+                     "features": {"virtual_printer": true, "camera_snapshot": true}}
+"""
+
+SUBSETS = ["api", "auth", "printers", "archives"]
+# subsets gathered by all, archives is left out as counting pages through all archives
+ALL = ["api", "auth", "printers"]
+
+# paths revealing a feature, path parameters are written as {}
+FEATURES = dict(
+    virtual_printer="/api/v1/settings/virtual-printer",
+    printer_status="/api/v1/printers/{}/status",
+    camera_snapshot="/api/v1/printers/{}/camera/snapshot",
+    firmware_updates="/api/v1/firmware/updates/{}",
+    archive_photos="/api/v1/archives/{}/photos/{}",
+    metrics="/api/v1/metrics",
+    auth="/api/v1/auth/status",
+)
+
+
+def subsets(gather_subset):
+    """
+    returns the set of subsets to gather, raises ValueError on unknown subsets
+    """
+    wanted = set()
+    excluded = set()
+    for subset in gather_subset:
+        name = subset[1:] if subset.startswith("!") else subset
+        if name not in SUBSETS + ["all"]:
+            raise ValueError(
+                f"unknown subset '{name}', choose from: all, {', '.join(SUBSETS)}"
+            )
+        names = ALL if name == "all" else [name]
+        (excluded if subset.startswith("!") else wanted).update(names)
+    return wanted - excluded
+
+
+def normalize_path(path):
+    return re.sub(r"\{[^}]*\}", "{}", path).rstrip("/")
+
+
+def parse_openapi(spec):
+    """
+    returns version, endpoints and features of an OpenAPI description
+    """
+    paths = {normalize_path(p): ops for p, ops in (spec.get("paths") or dict()).items()}
+    endpoints = dict()
+    for target, (path, paged) in api.ENDPOINTS.items():
+        operation = (paths.get(normalize_path(path)) or dict()).get("get")
+        if operation is None:
+            endpoints[target] = dict(path=path, available=False, paged=None)
+            continue
+        names = set(
+            p.get("name")
+            for p in operation.get("parameters") or list()
+            if isinstance(p, dict)
+        )
+        # only a description without both parameters reveals an endpoint without pagination,
+        # with just one of them it's unknown (null), so the flag of api.ENDPOINTS is kept
+        if "limit" in names and "offset" in names:
+            paged = True
+        elif "limit" in names or "offset" in names:
+            paged = None
+        else:
+            paged = False
+        endpoints[target] = dict(path=path, available=True, paged=paged)
+    features = {name: normalize_path(path) in paths for name, path in FEATURES.items()}
+    return (spec.get("info") or dict()).get("version"), endpoints, features
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        gather_subset=dict(
+            type="list", elements="str", required=False, default=["all"]
+        ),
+        openapi_path=dict(type="str", required=False, default="/openapi.json"),
+        page_size=dict(type="int", required=False, default=500),
+        cache=dict(type="bool", required=False, default=True),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        ansible_facts=dict(),
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    try:
+        url = module.params["url"].rstrip("/")
+        try:
+            gather = subsets(module.params["gather_subset"])
+        except ValueError as e:
+            module.fail_json(msg=str(e), **result)
+        if module.params["page_size"] < 1:
+            module.fail_json(msg="'page_size' needs to be at least 1", **result)
+
+        s = api.create_session(url, module.params["token"])
+        facts = dict(
+            url=url,
+            gathered_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        )
+
+        if "api" in gather:
+            response = s.get(url + module.params["openapi_path"])
+            if response.status_code == 200:
+                facts["version"], facts["endpoints"], facts["features"] = parse_openapi(
+                    response.json()
+                )
+            elif response.status_code == 404:
+                # the description can be disabled, nothing is known then
+                facts["version"] = None
+                facts["endpoints"] = {
+                    t: dict(path=e[0], available=None, paged=None)
+                    for t, e in api.ENDPOINTS.items()
+                }
+                facts["features"] = dict.fromkeys(FEATURES.keys())
+            else:
+                module.fail_json(
+                    msg="error on fetching OpenAPI description",
+                    response=response.text,
+                    **result,
+                )
+
+        if "auth" in gather:
+            response = s.get(url + "/api/v1/auth/status")
+            if not response.status_code == 200:
+                module.fail_json(
+                    msg="error on fetching auth status",
+                    response=response.text,
+                    **result,
+                )
+            status = response.json()
+            facts["auth"] = dict(
+                enabled=status.get("auth_enabled"),
+                requires_setup=status.get("requires_setup"),
+            )
+
+        try:
+            if "printers" in gather:
+                facts["printers"] = sum(1 for p in api.iterate(s, url, "printer"))
+            if "archives" in gather:
+                # the just gathered pagination support wins over the cached one
+                paged = (
+                    (facts.get("endpoints") or dict())
+                    .get("archive", dict())
+                    .get("paged")
+                )
+                # just counted, so the archives are kept out of the response cache
+                facts["archives"] = sum(
+                    1
+                    for a in api.iterate(
+                        api.create_session(url, module.params["token"], cache=False),
+                        url,
+                        "archive",
+                        page_size=module.params["page_size"],
+                        paged=paged,
+                    )
+                )
+        except api.APIError as e:
+            module.fail_json(msg=str(e), response=e.response, **result)
+
+        if module.params["cache"] and api.CACHE_ENABLED:
+            # facts of previous runs are kept for subsets not gathered this time
+            cache = api.FactsCache()
+            cache.store(url, dict(cache.load(url) or dict(), **facts))
+
+        result["ansible_facts"]["bambuddy_facts"] = facts
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "facts")
+
+
+if __name__ == "__main__":
+    main()
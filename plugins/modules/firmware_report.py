@@ -0,0 +1,366 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import re
+import threading
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    api,
+    output,
+    profiling,
+)
+
+
+DOCUMENTATION = r"""
+---
+module: firmware_report
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: report firmware state of all printers
+
+description:
+    - Fetches the firmware version and update state of every printer on one or more BamBuddy instances
+    - The requests are done concurrently with a bounded number of workers across all instances
+    - Returns the result aggregated by printer model and firmware version, the state of each printer can additionally be written to a CSV or JSON lines file
+    - Requires check_printer_firmware to be enabled (see module nils_ost.bambuddy.settings), else no latest version is known
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+            - mutually exclusive with instances
+        required: false
+        type: str
+        default: null
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    instances:
+        description:
+            - list of instances to report on, instead of url and token
+            - one of url and instances is required
+        required: false
+        type: list
+        elements: dict
+        default: null
+        suboptions:
+            url:
+                description:
+                    - the full URL of API-Endpoint
+                required: true
+                type: str
+            token:
+                description:
+                    - the token used for authentication on API-Endpoint
+                required: false
+                type: str
+                default: null
+    workers:
+        description:
+            - maximum number of concurrent requests
+        required: false
+        type: int
+        default: 8
+    output_file:
+        description:
+            - if set, the firmware state of every printer is written into this file (on the controller)
+            - the file is only replaced if it's content changed
+        required: false
+        type: path
+        default: null
+    format:
+        description:
+            - format of output_file
+        required: false
+        type: str
+        choices: ["csv", "jsonl"]
+        default: csv
+    compress:
+        description:
+            - gzip compress output_file
+        required: false
+        type: bool
+        default: false
+"""
+
+EXAMPLES = r"""
+# firmware report of all instances in the inventory
+- name: fetch tokens
+  nils_ost.bambuddy.token:
+    host: "{{ ansible_host }}"
+    port: "{{ bambuddy_port }}"
+    user: "{{ bambuddy_user | default(omit) }}"
+    password: "{{ bambuddy_user_password | default(omit) }}"
+  delegate_to: localhost
+  register: bambuddy
+
+- name: create firmware report
+  nils_ost.bambuddy.firmware_report:
+    # just url and token of every registered result
+    instances: "{{ ansible_play_hosts | map('extract', hostvars, 'bambuddy') | map('dict2items')
+      | map('selectattr', 'key', 'in', ['url', 'token']) | map('items2dict') | list }}"
+    output_file: /tmp/firmware.csv
+  delegate_to: localhost
+  run_once: true
+  register: firmware
+
+- name: show models with available updates
+  ansible.builtin.debug:
+    msg: "{{ firmware.models | dict2items | selectattr('value.update_available', 'gt', 0) | map(attribute='key') | list }}"
+  run_once: true
+"""
+
+RETURN = r"""
+models:
+    description:
+        - printers aggregated by model, with the number of printers, printers with an update available and per firmware version
+    type: dict
+    returned: always
+    sample: {"X1C": {"printers": 3, "update_available": 1, "latest_version": "01.08.02.00", "versions": {"01.08.02.00": 2, "01.07.00.00": 1}}}
+summary:
+    description:
+        - total number of printers, printers with an update available and printers the firmware state couldn't be fetched of
+        - an instance whose printers couldn't be listed counts as one error
+    type: dict
+    returned: always
+    sample: {"printers": 3, "update_available": 1, "errors": 0}
+printers:
+    description:
+        - firmware state of every printer
+        - if the printers of an instance couldn't be listed, the instance is contained once with just instance and error set
+        - is empty if output_file is set
+    type: list
+    elements: dict
+    returned: always
+count:
+    description:
+        - number of printers written to output_file
+    type: int
+    returned: if output_file is set
+checksum:
+    description:
+        - sha1 checksum of output_file
+    type: str
+    returned: if output_file is set
+path:
+    description:
+        - absolute path of output_file
+    type: str
+    returned: if output_file is set
+"""
+
+FIRMWARE_ENDPOINT = "/api/v1/firmware/updates/%s"
+COLUMNS = [
+    "instance",
+    "printer_id",
+    "name",
+    "model",
+    "serial_number",
+    "current_version",
+    "latest_version",
+    "update_available",
+    "error",
+]
+
+_local = threading.local()
+
+
+def thread_session(instance):
+    # one session per worker and instance, so connections are reused across the printers of an instance
+    sessions = _local.__dict__.setdefault("sessions", dict())
+    if instance["url"] not in sessions:
+        # the state changes with every firmware release, therefore the response cache isn't used
+        sessions[instance["url"]] = api.create_session(
+            instance["url"], instance["token"], cache=False
+        )
+    return sessions[instance["url"]]
+
+
+def list_printers(instance):
+    session = api.create_session(instance["url"], instance["token"])
+    try:
+        return [
+            dict(instance=instance, printer=p, error=None)
+            for p in api.iterate(session, instance["url"], "printer")
+        ]
+    except Exception as e:
+        # an unreachable instance shouldn't prevent the report of all others
+        error = e.response if isinstance(e, api.APIError) else str(e)
+        return [dict(instance=instance, printer=dict(), error=error)]
+
+
+def firmware_state(job):
+    instance = job["instance"]
+    printer = job["printer"]
+    state = dict(
+        instance=instance["url"],
+        printer_id=printer.get("id"),
+        name=printer.get("name"),
+        model=printer.get("model"),
+        serial_number=printer.get("serial_number"),
+        current_version=None,
+        latest_version=None,
+        update_available=False,
+        error=job["error"],
+    )
+    if state["error"] is not None:
+        return state
+    try:
+        response = thread_session(instance).get(
+            instance["url"] + FIRMWARE_ENDPOINT % printer["id"]
+        )
+    except Exception as e:
+        state["error"] = str(e)
+        return state
+    if not response.status_code == 200:
+        state["error"] = response.text
+        return state
+    data = response.json()
+    state["current_version"] = data.get("current_version")
+    state["latest_version"] = data.get("latest_version")
+    state["update_available"] = bool(data.get("update_available", False))
+    return state
+
+
+def version_key(version):
+    # firmware versions are dotted numbers with leading zeros (e.g. 01.08.02.00), compared numerically
+    return tuple(int(n) for n in re.findall(r"\d+", version))
+
+
+def aggregate(states):
+    models = dict()
+    summary = dict(printers=0, update_available=0, errors=0)
+    for state in states:
+        if state["printer_id"] is not None:
+            summary["printers"] += 1
+        if state["error"] is not None:
+            summary["errors"] += 1
+            continue
+        model = models.setdefault(
+            state["model"],
+            dict(printers=0, update_available=0, latest_version=None, versions=dict()),
+        )
+        model["printers"] += 1
+        version = state["current_version"] or "unknown"
+        model["versions"][version] = model["versions"].get(version, 0) + 1
+        # printers of a model can know different latest versions, the highest one is reported
+        if state["latest_version"] is not None and (
+            model["latest_version"] is None
+            or version_key(state["latest_version"])
+            > version_key(model["latest_version"])
+        ):
+            model["latest_version"] = state["latest_version"]
+        if state["update_available"]:
+            model["update_available"] += 1
+            summary["update_available"] += 1
+    return models, summary
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=False, default=None),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        instances=dict(
+            type="list",
+            elements="dict",
+            required=False,
+            default=None,
+            options=dict(
+                url=dict(type="str", required=True),
+                token=dict(type="str", required=False, default=None, no_log=True),
+            ),
+        ),
+        workers=dict(type="int", required=False, default=8),
+        output_file=dict(type="path", required=False, default=None),
+        format=dict(
+            type="str", required=False, default="csv", choices=["csv", "jsonl"]
+        ),
+        compress=dict(type="bool", required=False, default=False),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        models=dict(),
+        summary=dict(),
+        printers=list(),
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        mutually_exclusive=[("url", "instances")],
+        required_one_of=[("url", "instances")],
+        supports_check_mode=True,
+    )
+
+    try:
+        instances = module.params["instances"] or list()
+        if module.params["url"] is not None:
+            instances = [dict(url=module.params["url"], token=module.params["token"])]
+        workers = module.params["workers"]
+        if workers < 1:
+            module.fail_json(msg="'workers' needs to be at least 1", **result)
+
+        jobs = [
+            job
+            for jobs in api.parallel(list_printers, instances, workers)
+            for job in jobs
+        ]
+
+        states = api.parallel(firmware_state, jobs, workers)
+        result["models"], result["summary"] = aggregate(states)
+
+        if module.params["output_file"] is None:
+            result["printers"] = states
+        else:
+            with output.OutputFile(
+                module.params["output_file"],
+                compress=module.params["compress"],
+                check_mode=module.check_mode,
+            ) as out:
+                if module.params["format"] == "csv":
+                    out.write_csv(COLUMNS)
+                    for state in states:
+                        out.write_csv([state[c] for c in COLUMNS])
+                else:
+                    for state in states:
+                        out.write_json(state)
+            result["changed"] = out.changed
+            result["count"] = len(states)
+            result["checksum"] = out.checksum
+            result["path"] = out.path
+
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "firmware_report")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,9 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import requests
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, profiling
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils.output import OutputFile
 
 
 DOCUMENTATION = r"""
@@ -44,7 +44,50 @@ options:
         required: false
         type: str
         default: "printer"
-        choices: ["printer"]
+        choices: ["printer", "archive", "queue", "library_file", "spool", "smart_plug", "notification_provider"]
+    filters:
+        description:
+            - only elements are returned, where all keys have the given value
+            - a list as value matches if any of it's values match
+            - filters are send as query parameters and are applied on the API response as well, as not every endpoint is able to filter
+            - the module fails if a key isn't a field of the elements of target
+        required: false
+        type: dict
+        default: {}
+    fields:
+        description:
+            - if set, only these keys of every element are returned
+        required: false
+        type: list
+        elements: str
+        default: []
+    limit:
+        description:
+            - maximum number of elements to be returned
+            - if ommited or set to null all elements are returned
+        required: false
+        type: int
+        default: null
+    page_size:
+        description:
+            - number of elements fetched per request, on targets supporting pagination (archive)
+            - if the server returns less elements per request, its page size is used
+        required: false
+        type: int
+        default: 100
+    output_file:
+        description:
+            - if set, elements are streamed page by page into this file (on the controller) as JSON lines, instead of being returned as data
+            - the file is only replaced if it's content changed
+        required: false
+        type: path
+        default: null
+    compress:
+        description:
+            - gzip compress output_file
+        required: false
+        type: bool
+        default: false
 """
 
 EXAMPLES = r"""
@@ -56,14 +99,68 @@ EXAMPLES = r"""
     target: printer
   delegate_to: localhost
   register: existing_printers
+
+# fetches just the names of all X1C printers located in the basement
+- name: Pulling printer names
+  nils_ost.bambuddy.list:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    target: printer
+    filters:
+      location: basement
+      model: X1C
+    fields:
+      - name
+  delegate_to: localhost
+  register: basement_printers
+
+# fetches the 500 latest archives of two printers
+- name: Pulling archives
+  nils_ost.bambuddy.list:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    target: archive
+    filters:
+      printer_id: [1, 2]
+    limit: 500
+  delegate_to: localhost
+  register: archives
+
+# writes all archives into a compressed JSON lines file
+- name: Exporting archives
+  nils_ost.bambuddy.list:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    target: archive
+    output_file: "/tmp/archives.jsonl.gz"
+    compress: true
+  delegate_to: localhost
+  register: archives_export
 """
 
 RETURN = r"""
 data:
     description:
         - list of existing elements of type target
+        - elements only contain the keys given in fields, if fields is set
+        - is empty if output_file is set
     type: list
     returned: always
+count:
+    description:
+        - number of elements written to output_file
+    type: int
+    returned: if output_file is set
+checksum:
+    description:
+        - sha1 checksum of output_file
+    type: str
+    returned: if output_file is set
+path:
+    description:
+        - absolute path of output_file
+    type: str
+    returned: if output_file is set
 """
 
 
@@ -76,8 +173,14 @@ def run_module():
             type="str",
             required=False,
             default="printer",
-            choices=["printer"],
+            choices=list(api.ENDPOINTS.keys()),
         ),
+        filters=dict(type="dict", required=False, default=dict()),
+        fields=dict(type="list", elements="str", required=False, default=list()),
+        limit=dict(type="int", required=False, default=None),
+        page_size=dict(type="int", required=False, default=100),
+        output_file=dict(type="path", required=False, default=None),
+        compress=dict(type="bool", required=False, default=False),
     )
 
     # seed the result dict in the object
@@ -102,25 +205,44 @@ def run_module():
     try:
         url = module.params["url"]
 
-        s = requests.Session()
-        s.headers["Content-Type"] = "application/json"
-        if module.params["token"] is not None and not module.params["token"] == "":
-            s.headers["Authorization"] = "Bearer %s" % module.params["token"]
+        s = api.create_session(url, module.params["token"])
 
-        if module.params["target"] == "printer":
-            uri = url + "/api/v1/printers/"
-        else:
-            module.fail_json(msg="invalid target", **result)
+        if module.params["page_size"] < 1:
+            module.fail_json(msg="'page_size' needs to be at least 1", **result)
+        if module.params["limit"] is not None and module.params["limit"] < 0:
+            module.fail_json(msg="'limit' needs to be at least 0", **result)
 
-        response = s.get(uri)
-        if not response.status_code == 200:
-            module.fail_json(
-                msg="error fetching list",
-                response=response.text,
-                **result,
-            )
+        items = api.iterate(
+            s,
+            url,
+            module.params["target"],
+            filters=module.params["filters"],
+            page_size=module.params["page_size"],
+            limit=module.params["limit"],
+        )
 
-        result["data"] = response.json()
+        try:
+            if module.params["output_file"] is None:
+                result["data"] = [
+                    api.project(item, module.params["fields"]) for item in items
+                ]
+            else:
+                result["data"] = list()
+                with OutputFile(
+                    module.params["output_file"],
+                    compress=module.params["compress"],
+                    check_mode=module.check_mode,
+                ) as output:
+                    for item in items:
+                        output.write_json(api.project(item, module.params["fields"]))
+                result["changed"] = output.changed
+                result["count"] = output.count
+                result["checksum"] = output.checksum
+                result["path"] = output.path
+        except api.APIError as e:
+            module.fail_json(msg="error fetching list", response=e.response, **result)
+        except ValueError as e:
+            module.fail_json(msg=str(e), **result)
 
         module.exit_json(msg="fetching list successful", **result)
 
@@ -129,7 +251,7 @@ def run_module():
 
 
 def main():
-    run_module()
+    profiling.run(run_module, "list")
 
 
 if __name__ == "__main__":
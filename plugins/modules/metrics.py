@@ -0,0 +1,163 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    api,
+    profiling,
+    prometheus,
+)
+
+
+DOCUMENTATION = r"""
+---
+module: metrics
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: read Prometheus metrics
+
+description:
+    - Fetches the Prometheus endpoint of BamBuddy and returns the requested metric families
+    - The response is parsed line by line while it's received, samples not requested are dropped right away
+    - Requires prometheus_enabled to be set (see module nils_ost.bambuddy.settings)
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the prometheus_token configured in settings
+            - if token is ommited or set to null, the endpoint is requested without authentication
+        required: false
+        type: str
+        default: null
+    path:
+        description:
+            - path of the Prometheus endpoint
+        required: false
+        type: str
+        default: "/api/v1/metrics"
+    families:
+        description:
+            - names of the metric families to be returned, shell-style wildcards are supported
+            - if empty all families are returned
+        required: false
+        type: list
+        elements: str
+        default: []
+    matchers:
+        description:
+            - PromQL like label matchers (=, !=, =~, !~), a sample needs to match all of them
+        required: false
+        type: list
+        elements: str
+        default: []
+"""
+
+EXAMPLES = r"""
+# fetch the connection state of all X1C printers
+- name: read metrics
+  nils_ost.bambuddy.metrics:
+    url: "{{ bambuddy.url }}"
+    token: "{{ prometheus_token }}"
+    families:
+      - bambuddy_printer_connected
+    matchers:
+      - 'model="X1C"'
+  delegate_to: localhost
+  register: printer_metrics
+
+- name: show disconnected printers
+  ansible.builtin.debug:
+    msg: "{{ samples | selectattr('value', 'equalto', 0) | map(attribute='labels.printer_name') | list }}"
+  vars:
+    samples: "{{ printer_metrics.metrics.bambuddy_printer_connected.samples }}"
+"""
+
+RETURN = r"""
+metrics:
+    description:
+        - dict of the requested metric families by name
+        - every family contains type, help and the list of samples
+        - a sample contains labels and value, and name if it's name differs from the family (e.g. _bucket, _sum of histograms)
+    type: dict
+    returned: always
+    sample: {"bambuddy_printer_connected": {"type": "gauge", "help": "", "samples": [{"labels": {"printer_name": "printer1"}, "value": 1.0}]}}
+"""
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        path=dict(type="str", required=False, default="/api/v1/metrics"),
+        families=dict(type="list", elements="str", required=False, default=list()),
+        matchers=dict(type="list", elements="str", required=False, default=list()),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        metrics=dict(),
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    try:
+        url = module.params["url"]
+
+        try:
+            prometheus.parse_matchers(module.params["matchers"])
+        except ValueError as e:
+            module.fail_json(msg=str(e), **result)
+
+        session = api.create_session(url, module.params["token"], cache=False)
+
+        with session.get(url + module.params["path"], stream=True) as response:
+            if not response.status_code == 200:
+                module.fail_json(
+                    msg="error fetching metrics",
+                    response=response.text,
+                    **result,
+                )
+            result["metrics"] = prometheus.parse(
+                response.iter_lines(),
+                families=module.params["families"],
+                matchers=module.params["matchers"],
+            )
+
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "metrics")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,12 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import requests
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    api,
+    models,
+    profiling,
+)
 
 
 DOCUMENTATION = r"""
@@ -24,6 +27,10 @@ short_description: manage printer
 
 description:
     - Creates, updates or deletes a printer
+    - Printers are identified by serial_number first and by name second,
+      so a printer with a known serial_number but a different name is renamed instead of created again
+    - Changes of ip_address, serial_number or access_code (and creating a printer) make BamBuddy (re)connect to the printer,
+      with defer_connection they are left out and just reported in connection_pending, so they can be rolled out in waves
 
 options:
     url:
@@ -41,7 +48,7 @@ options:
     name:
         description:
             - descriptive name of printer
-            - needs to be uniqe as it used as identifier for this module
+            - needs to be uniqe as it used as identifier for this module (if no printer with the same serial_number exists)
         required: true
         type: str
     ip_address:
@@ -88,6 +95,14 @@ options:
         type: str
         default: "present"
         choices: ["present", "absent"]
+    defer_connection:
+        description:
+            - if true, changes affecting the connection to the printer (ip_address, serial_number, access_code) are not applied
+              and a missing printer is not created, all other changes are applied as usual
+            - the printer is reported in connection_pending instead
+        required: false
+        type: bool
+        default: false
 """
 
 EXAMPLES = r"""
@@ -122,6 +137,24 @@ EXAMPLES = r"""
     name: test1
     state: absent
   delegate_to: localhost
+
+# apply just the changes not causing a reconnect
+- name: update printer without reconnect
+  nils_ost.bambuddy.printer:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    name: test1
+    ip_address: 192.168.0.56
+    serial_number: 01P00A000000000
+    access_code: 12345678
+    location: attic
+    defer_connection: true
+  delegate_to: localhost
+  register: printer
+
+- name: show if a reconnect is pending
+  ansible.builtin.debug:
+    var: printer.connection_pending
 """
 
 RETURN = r"""
@@ -131,29 +164,25 @@ data:
         - is empty if state is absent
     type: dict
     returned: always
+connection_pending:
+    description:
+        - true if changes affecting the connection were left out by defer_connection
+    type: bool
+    returned: always
 """
 
+# changing one of these makes BamBuddy drop and re-establish the MQTT/FTPS sessions to the printer
+CONNECTION_FIELDS = ("ip_address", "serial_number", "access_code")
 
-def data_as_expected(d1, d2):
-    for k in d1.keys():
-        if k not in d2:
-            return False
-        if not d1.get(k) == d2.get(k):
-            return False
-    return True
 
-
-def search(url, session, name):
+def search(url, session):
     uri = f"{url}/api/v1/printers/"
 
     response = session.get(uri)
     if not response.status_code == 200:
         return (False, response.text)
 
-    for item in response.json():
-        if name == item.get("name", ""):
-            return (True, item)
-    return (True, None)
+    return (True, models.Printers.from_response(response))
 
 
 def create(url, session, data):
@@ -219,6 +248,7 @@ def run_module():
             default="present",
             choices=["present", "absent"],
         ),
+        defer_connection=dict(type="bool", required=False, default=False),
     )
 
     # seed the result dict in the object
@@ -229,6 +259,7 @@ def run_module():
     result = dict(
         changed=False,
         data=dict(),
+        connection_pending=False,
     )
 
     # the AnsibleModule object will be our abstraction working with Ansible
@@ -243,10 +274,7 @@ def run_module():
     try:
         url = module.params["url"]
 
-        session = requests.Session()
-        session.headers["Content-Type"] = "application/json"
-        if module.params["token"] is not None and not module.params["token"] == "":
-            session.headers["Authorization"] = "Bearer %s" % module.params["token"]
+        session = api.create_session(url, module.params["token"])
 
         if module.params["state"] == "present":
             for param in ["ip_address", "serial_number", "access_code"]:
@@ -256,9 +284,15 @@ def run_module():
                         **result,
                     )
 
-        success, element = search(url, session, module.params["name"])
+        success, printers = search(url, session)
         if not success:
-            module.fail_json(msg=f"error on searching for element: {element}", **result)
+            module.fail_json(
+                msg=f"error on searching for element: {printers}", **result
+            )
+        element = printers.get(
+            serial_number=module.params["serial_number"],
+            name=module.params["name"],
+        )
 
         if module.params["state"] == "present":
             data = dict(
@@ -272,6 +306,9 @@ def run_module():
             )
 
             if element is None:
+                if module.params["defer_connection"]:
+                    result["connection_pending"] = True
+                    module.exit_json(msg="deferred creating element", **result)
                 if not module.check_mode:
                     success, element = create(url, session, data)
                     if not success:
@@ -289,14 +326,27 @@ def run_module():
                     module.exit_json(msg="would have created a element", **result)
 
             else:
+                renamed = not element.name == data["name"]
+                if renamed and data["name"] in printers.by_name:
+                    module.fail_json(
+                        msg=f"can't rename printer '{element.name}' (serial_number {element.serial_number}), "
+                        + f"another printer is already named '{data['name']}'",
+                        **result,
+                    )
+                if module.params["defer_connection"]:
+                    result["connection_pending"] = any(
+                        k in CONNECTION_FIELDS for k in element.diff(data).keys()
+                    )
+                    # the connection is kept as it is for now
+                    data.update(element.to_dict(CONNECTION_FIELDS))
+                if element.matches(data):
+                    result["data"] = element.raw
+                    module.exit_json(
+                        msg="element is already as expected",
+                        **result,
+                    )
                 if not module.check_mode:
-                    if data_as_expected(data, element):
-                        result["data"] = element
-                        module.exit_json(
-                            msg="element is already as expected",
-                            **result,
-                        )
-                    success, element = update(url, session, element.get("id"), data)
+                    success, element = update(url, session, element.id, data)
                     if not success:
                         module.fail_json(
                             msg="error on updateing existing element",
@@ -305,12 +355,17 @@ def run_module():
                         )
                     result["changed"] = True
                     result["data"] = element
-                    module.exit_json(msg="updated element", **result)
+                    module.exit_json(
+                        msg="renamed element" if renamed else "updated element",
+                        **result,
+                    )
                 else:
                     result["changed"] = True
                     result["data"] = data
                     module.exit_json(
-                        msg="would have updated element",
+                        msg="would have renamed element"
+                        if renamed
+                        else "would have updated element",
                         **result,
                     )
 
@@ -318,7 +373,7 @@ def run_module():
             if element is None:
                 module.exit_json(msg="element is already deleted", **result)
             if not module.check_mode:
-                success, element = delete(url, session, element.get("id"))
+                success, element = delete(url, session, element.id)
                 if not success:
                     module.fail_json(
                         msg="error on deleteing element",
@@ -336,7 +391,7 @@ def run_module():
 
 
 def main():
-    run_module()
+    profiling.run(run_module, "printer")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,294 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import math
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, profiling
+
+
+DOCUMENTATION = r"""
+---
+module: probe
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: measure API latency and throughput
+
+description:
+    - Runs a read-only workload against the API and reports latency percentiles, throughput, error rate and response sizes
+    - A number of concurrent clients request the endpoints in turn for a fixed duration
+    - Every endpoint and the printer status endpoints (as one, in turn over all printers) are requested equally often,
+      so the result doesn't depend on the number of printers
+    - The rate limit of the collection (BAMBUDDY_RATE_LIMIT, BAMBUDDY_MAX_IN_FLIGHT) isn't applied, as it would skew the results
+    - Can be used to compare instances or hardware before adding more printers to an instance
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    clients:
+        description:
+            - number of concurrent clients
+        required: false
+        type: int
+        default: 4
+    duration:
+        description:
+            - seconds the workload is running
+        required: false
+        type: float
+        default: 10
+    timeout:
+        description:
+            - seconds after which a single request is counted as error
+        required: false
+        type: float
+        default: 10
+    endpoints:
+        description:
+            - paths requested by the clients
+        required: false
+        type: list
+        elements: str
+        default: ["/api/v1/printers/", "/api/v1/settings/"]
+    printer_status:
+        description:
+            - additionally request the status endpoints of the printers, as one more endpoint
+        required: false
+        type: bool
+        default: true
+"""
+
+EXAMPLES = r"""
+# probe an instance with 16 clients for a minute
+- name: probe API
+  nils_ost.bambuddy.probe:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    clients: 16
+    duration: 60
+  delegate_to: localhost
+  register: probe
+
+- name: show result
+  ansible.builtin.debug:
+    msg: "{{ probe.throughput }} req/s, p95 {{ probe.latency.p95 }} ms, {{ probe.error_rate * 100 }} % errors"
+"""
+
+RETURN = r"""
+requests:
+    description:
+        - number of executed requests
+    type: int
+    returned: always
+errors:
+    description:
+        - number of failed requests (connection errors, timeouts and non 200 responses)
+    type: int
+    returned: always
+error_rate:
+    description:
+        - errors divided by requests
+    type: float
+    returned: always
+throughput:
+    description:
+        - requests per second
+    type: float
+    returned: always
+latency:
+    description:
+        - latency in milliseconds of successful requests (min, mean, p50, p95, p99, max)
+    type: dict
+    returned: always
+    sample: {"min": 2.1, "mean": 8.3, "p50": 6.9, "p95": 18.2, "p99": 31.0, "max": 54.7}
+bytes:
+    description:
+        - size of response bodies in bytes (total, mean, max)
+    type: dict
+    returned: always
+endpoints:
+    description:
+        - the same values (requests, errors, latency, bytes) per endpoint, all printer status endpoints are combined
+    type: dict
+    returned: always
+"""
+
+STATUS_ENDPOINT = "/api/v1/printers/{id}/status"
+
+
+def percentile(values, p):
+    # nearest-rank on sorted values
+    if len(values) == 0:
+        return None
+    return values[max(0, int(math.ceil(p / 100.0 * len(values))) - 1)]
+
+
+def summarize(samples, duration):
+    latencies = sorted(s[0] for s in samples if s[1])
+    sizes = [s[2] for s in samples]
+    errors = len([s for s in samples if not s[1]])
+    summary = dict(
+        requests=len(samples),
+        errors=errors,
+        error_rate=round(errors / len(samples), 4) if samples else 0.0,
+        throughput=round(len(samples) / duration, 2) if duration > 0 else 0.0,
+        latency=dict(min=None, mean=None, p50=None, p95=None, p99=None, max=None),
+        bytes=dict(
+            total=sum(sizes),
+            mean=round(sum(sizes) / len(sizes), 1) if sizes else 0,
+            max=max(sizes) if sizes else 0,
+        ),
+    )
+    if latencies:
+        summary["latency"] = dict(
+            min=round(latencies[0], 2),
+            mean=round(sum(latencies) / len(latencies), 2),
+            p50=round(percentile(latencies, 50), 2),
+            p95=round(percentile(latencies, 95), 2),
+            p99=round(percentile(latencies, 99), 2),
+            max=round(latencies[-1], 2),
+        )
+    return summary
+
+
+def workload(url, token, targets, clients, duration, timeout):
+    """
+    runs clients concurrent clients for duration seconds, targets are (name, paths) with every name requested equally often
+    and its paths in turn, returns the samples (name, latency in ms, success, size) and the elapsed seconds
+    """
+    deadline = time.monotonic() + duration
+
+    def client(number):
+        # without limiter, the rate limit of the collection would be measured instead of the instance
+        session = api.create_session(url, token, cache=False, limit=False)
+        samples = list()
+        i = number
+        while time.monotonic() < deadline:
+            name, paths = targets[i % len(targets)]
+            path = paths[(i // len(targets)) % len(paths)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                response = session.get(url + path, timeout=timeout)
+                size = len(response.content)
+                success = response.status_code == 200
+            except Exception:
+                size = 0
+                success = False
+            samples.append((name, (time.perf_counter() - start) * 1000, success, size))
+        return samples
+
+    started = time.monotonic()
+    samples = [s for c in api.parallel(client, range(clients), clients) for s in c]
+    return samples, time.monotonic() - started
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        clients=dict(type="int", required=False, default=4),
+        duration=dict(type="float", required=False, default=10),
+        timeout=dict(type="float", required=False, default=10),
+        endpoints=dict(
+            type="list",
+            elements="str",
+            required=False,
+            default=["/api/v1/printers/", "/api/v1/settings/"],
+        ),
+        printer_status=dict(type="bool", required=False, default=True),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    try:
+        url = module.params["url"]
+        token = module.params["token"]
+
+        if module.params["clients"] < 1:
+            module.fail_json(msg="'clients' needs to be at least 1", **result)
+
+        # (endpoint name, paths), all printer status endpoints are one endpoint
+        targets = [(e, [e]) for e in module.params["endpoints"]]
+        if module.params["printer_status"]:
+            try:
+                session = api.create_session(url, token, cache=False, limit=False)
+                paths = [
+                    STATUS_ENDPOINT.format(id=printer["id"])
+                    for printer in api.iterate(session, url, "printer")
+                ]
+            except api.APIError as e:
+                module.fail_json(msg=str(e), response=e.response, **result)
+            if paths:
+                targets.append((STATUS_ENDPOINT, paths))
+        if len(targets) == 0:
+            module.fail_json(msg="no endpoints to probe", **result)
+
+        samples, elapsed = workload(
+            url,
+            token,
+            targets,
+            module.params["clients"],
+            module.params["duration"],
+            module.params["timeout"],
+        )
+
+        result.update(summarize([s[1:] for s in samples], elapsed))
+        result["endpoints"] = dict()
+        for name, paths in targets:
+            summary = summarize([s[1:] for s in samples if s[0] == name], elapsed)
+            result["endpoints"][name] = dict(
+                requests=summary["requests"],
+                errors=summary["errors"],
+                latency=summary["latency"],
+                bytes=summary["bytes"],
+            )
+
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "probe")
+
+
+if __name__ == "__main__":
+    main()
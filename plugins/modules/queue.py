@@ -0,0 +1,293 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+from itertools import cycle
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, profiling
+
+
+DOCUMENTATION = r"""
+---
+module: queue
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: distribute print jobs across printers
+
+description:
+    - Adds a batch of library files to the print queue
+    - Jobs are not assigned to a given printer, but to printers of a location and/or model, selected by policy
+    - The print queue is fetched once per batch, all assignments are planned on this state
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    files:
+        description:
+            - library files to be printed, each element is either the id or the filename of a library file
+            - a file listed multiple times is printed multiple times
+        required: true
+        type: list
+        elements: raw
+    location:
+        description:
+            - only printers of this location are used
+        required: false (true if model is not set)
+        type: str
+        default: null
+    model:
+        description:
+            - only printers of this model are used
+        required: false (true if location is not set)
+        type: str
+        default: null
+        choices: ["H2C", "H2D", "H2D Pro", "H2S", "X1E", "X1C", "X1", "P2S", "P1S", "P1P", "A1", "A1 Mini"]
+    policy:
+        description:
+            - least_loaded assigns every job to the printer with the fewest queued jobs
+            - round_robin assigns the jobs in turn to the printers ordered by name
+            - earliest_finish assigns every job to the printer with the lowest sum of estimated print times of it's queued jobs
+        required: false
+        type: str
+        default: "least_loaded"
+        choices: ["least_loaded", "round_robin", "earliest_finish"]
+"""
+
+EXAMPLES = r"""
+# print three plates on the printers in the basement
+- name: enqueue batch
+  nils_ost.bambuddy.queue:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    files:
+      - plate_1.3mf
+      - plate_2.3mf
+      - plate_2.3mf
+    location: basement
+  delegate_to: localhost
+
+# spread a batch over all P1S by estimated finish time
+- name: enqueue batch
+  nils_ost.bambuddy.queue:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    files: [12, 13, 14, 15]
+    model: P1S
+    policy: earliest_finish
+  delegate_to: localhost
+"""
+
+RETURN = r"""
+jobs:
+    description:
+        - the enqueued jobs with their assigned printer
+        - in check_mode the jobs that would have been enqueued
+    type: list
+    returned: always
+    sample: [{"file": "plate_1.3mf", "library_file_id": 12, "printer": "printer1", "printer_id": 1, "queue_id": 42}]
+"""
+
+ACTIVE_STATES = ["pending", "printing"]
+
+
+def estimated_seconds(item):
+    for k in ["print_time_seconds", "estimated_time", "print_time"]:
+        if item.get(k) is not None:
+            return item[k]
+    metadata = item.get("metadata") or dict()
+    if isinstance(metadata, dict) and metadata.get("print_time") is not None:
+        return metadata["print_time"]
+    return 0
+
+
+def resolve_files(files, library):
+    by_id = dict()
+    by_name = dict()
+    for item in library:
+        by_id[str(item.get("id"))] = item
+        by_name.setdefault(item.get("filename"), item)
+    resolved = list()
+    missing = list()
+    for f in files:
+        item = by_id.get(str(f)) or by_name.get(f)
+        if item is None:
+            missing.append(f)
+        else:
+            resolved.append(item)
+    return (resolved, missing)
+
+
+def plan(printers, queue, files, policy):
+    load = {p["id"]: 0 for p in printers}
+    busy = {p["id"]: 0 for p in printers}
+    for item in queue:
+        if (
+            item.get("printer_id") in load
+            and item.get("status", "pending") in ACTIVE_STATES
+        ):
+            load[item["printer_id"]] += 1
+            busy[item["printer_id"]] += estimated_seconds(item)
+
+    order = sorted(printers, key=lambda p: p.get("name", ""))
+    rr = cycle(order)
+    jobs = list()
+    for f in files:
+        if policy == "round_robin":
+            printer = next(rr)
+        elif policy == "earliest_finish":
+            printer = min(order, key=lambda p: (busy[p["id"]], load[p["id"]]))
+        else:
+            printer = min(order, key=lambda p: (load[p["id"]], busy[p["id"]]))
+        load[printer["id"]] += 1
+        busy[printer["id"]] += estimated_seconds(f)
+        jobs.append(
+            dict(
+                file=f.get("filename"),
+                library_file_id=f.get("id"),
+                printer=printer.get("name"),
+                printer_id=printer["id"],
+            ),
+        )
+    return jobs
+
+
+def enqueue(url, session, job):
+    uri = f"{url}/api/v1/queue/"
+
+    data = dict(
+        printer_id=job["printer_id"],
+        library_file_id=job["library_file_id"],
+    )
+    response = session.post(uri, json=data)
+    if not response.status_code == 200:
+        return (False, response.text)
+    return (True, response.json())
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        files=dict(type="list", elements="raw", required=True),
+        location=dict(type="str", required=False, default=None),
+        model=dict(
+            type="str",
+            required=False,
+            default=None,
+            choices=[
+                "H2C",
+                "H2D",
+                "H2D Pro",
+                "H2S",
+                "X1E",
+                "X1C",
+                "X1",
+                "P2S",
+                "P1S",
+                "P1P",
+                "A1",
+                "A1 Mini",
+            ],
+        ),
+        policy=dict(
+            type="str",
+            required=False,
+            default="least_loaded",
+            choices=["least_loaded", "round_robin", "earliest_finish"],
+        ),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        jobs=list(),
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        required_one_of=[("location", "model")],
+        supports_check_mode=True,
+    )
+
+    try:
+        url = module.params["url"]
+
+        session = api.create_session(url, module.params["token"])
+
+        if len(module.params["files"]) == 0:
+            module.exit_json(msg="nothing to enqueue", **result)
+
+        filters = dict()
+        for k in ["location", "model"]:
+            if module.params[k] is not None:
+                filters[k] = module.params[k]
+
+        try:
+            printers = list(api.iterate(session, url, "printer", filters=filters))
+            if len(printers) == 0:
+                module.fail_json(msg=f"no printer found matching {filters}", **result)
+            library = api.iterate(session, url, "library_file")
+            files, missing = resolve_files(module.params["files"], library)
+            if len(missing) > 0:
+                module.fail_json(msg=f"library files not found: {missing}", **result)
+            queue = list(api.iterate(session, url, "queue"))
+        except api.APIError as e:
+            module.fail_json(msg=str(e), response=e.response, **result)
+
+        jobs = plan(printers, queue, files, module.params["policy"])
+        result["changed"] = True
+
+        if module.check_mode:
+            result["jobs"] = jobs
+            module.exit_json(msg="would have enqueued jobs", **result)
+
+        for job in jobs:
+            success, element = enqueue(url, session, job)
+            if not success:
+                module.fail_json(
+                    msg=f"error on enqueueing {job['file']} for {job['printer']}",
+                    response=element,
+                    **result,
+                )
+            job["queue_id"] = element.get("id")
+            result["jobs"].append(job)
+
+        module.exit_json(msg="enqueued jobs", **result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "queue")
+
+
+if __name__ == "__main__":
+    main()
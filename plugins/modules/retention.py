@@ -0,0 +1,385 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, profiling
+
+
+DOCUMENTATION = r"""
+---
+module: retention
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: apply retention policies on print archives
+
+description:
+    - Deletes print archives (or just their photos) according to retention policies, to keep the disk usage of BamBuddy bounded
+    - An archive is affected if it violates any of the configured policies, at least one policy is required
+    - The archives are paged through once and sorted by creation time (newest first) to plan the deletions,
+      which are then executed in batches with bounded concurrency
+    - Archives without creation time are treated as newest, so they are never affected by keep_per_printer and max_size_mb
+    - Archives marked as favorite are never affected, unless keep_favorites is disabled,
+      kept favorites count towards keep_per_printer and max_size_mb, so the limits hold for all kept archives
+    - In check mode the number of archives and the bytes that would be freed are reported
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    keep_days:
+        description:
+            - archives created more than this many days ago are affected
+        required: false
+        type: int
+        default: null
+    keep_per_printer:
+        description:
+            - just the newest this many archives per printer are kept, all older ones are affected
+        required: false
+        type: int
+        default: null
+    max_size_mb:
+        description:
+            - the newest archives are kept as long as the sum of their file sizes stays below this size, all older ones are affected
+            - can't be used with action photos, as the size of photos isn't known
+        required: false
+        type: float
+        default: null
+    action:
+        description:
+            - with delete the affected archives are deleted completely
+            - with photos just the photos of the affected archives are deleted, the archives (metadata, 3MF file and thumbnail) are kept
+        required: false
+        type: str
+        choices: ["delete", "photos"]
+        default: delete
+    keep_favorites:
+        description:
+            - never affect archives marked as favorite
+            - favorites still count towards keep_per_printer and max_size_mb, so less other archives are kept
+        required: false
+        type: bool
+        default: true
+    page_size:
+        description:
+            - number of archives fetched per request
+        required: false
+        type: int
+        default: 100
+    batch_size:
+        description:
+            - number of deletions per batch, following batches are not executed if a batch had errors
+        required: false
+        type: int
+        default: 100
+    workers:
+        description:
+            - maximum number of concurrent delete requests
+        required: false
+        type: int
+        default: 4
+"""
+
+EXAMPLES = r"""
+# keep a year of archives, but at most 200 per printer and 50GB in total
+- name: apply archive retention
+  nils_ost.bambuddy.retention:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    keep_days: 365
+    keep_per_printer: 200
+    max_size_mb: 51200
+  delegate_to: localhost
+
+# drop photos of archives older than 30 days
+- name: drop old photos
+  nils_ost.bambuddy.retention:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    keep_days: 30
+    action: photos
+  delegate_to: localhost
+"""
+
+RETURN = r"""
+archives:
+    description:
+        - number of affected archives
+    type: int
+    returned: always
+photos:
+    description:
+        - number of (to be) deleted photos
+    type: int
+    returned: always
+freed_bytes:
+    description:
+        - sum of the file sizes of the (to be) deleted archives
+        - always 0 with action photos, as the size of photos isn't known
+    type: int
+    returned: always
+ids:
+    description:
+        - ids of the affected archives
+    type: list
+    elements: int
+    returned: always
+"""
+
+PHOTO_ENDPOINT = "/api/v1/archives/%s/photos/%s"
+
+# just the parts of an archive required for planning and deletion, so not the whole archives are kept
+Archive = namedtuple(
+    "Archive", ["id", "created", "printer_id", "file_size", "favorite", "photos"]
+)
+
+
+def parse_time(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+    t = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if t.tzinfo is None:
+        t = t.replace(tzinfo=timezone.utc)
+    return t
+
+
+def photo_names(archive):
+    names = list()
+    for photo in archive.get("photos") or list():
+        # photos are listed by file name, some versions return objects instead
+        name = photo.get("filename") if isinstance(photo, dict) else photo
+        if name:
+            names.append(name)
+    return names
+
+
+def summarize(archive):
+    return Archive(
+        id=archive["id"],
+        created=parse_time(archive.get("created_at")),
+        printer_id=archive.get("printer_id"),
+        file_size=archive.get("file_size") or 0,
+        favorite=bool(archive.get("is_favorite")),
+        photos=photo_names(archive),
+    )
+
+
+def newest_first(archives):
+    """
+    returns archives (of summarize) sorted by creation time, newest first,
+    as the order of the API isn't guaranteed, archives without creation time come first
+    """
+    return sorted(
+        archives,
+        key=lambda a: (
+            a.created is None,
+            a.created or datetime.min.replace(tzinfo=timezone.utc),
+            a.id,
+        ),
+        reverse=True,
+    )
+
+
+class Planner:
+    """
+    decides for every archive (of summarize, fed newest first) whether it is affected by the policies
+    """
+
+    def __init__(
+        self,
+        keep_days=None,
+        keep_per_printer=None,
+        max_size_mb=None,
+        keep_favorites=True,
+    ):
+        self.cutoff = None
+        if keep_days is not None:
+            self.cutoff = datetime.now(timezone.utc) - timedelta(days=keep_days)
+        self.keep_per_printer = keep_per_printer
+        self.max_bytes = max_size_mb * 1024 * 1024 if max_size_mb is not None else None
+        self.keep_favorites = keep_favorites
+        self.per_printer = dict()
+        self.kept_bytes = 0
+
+    def affected(self, archive):
+        affected = False
+        created = archive.created
+        if self.cutoff is not None and created is not None and created < self.cutoff:
+            affected = True
+        if self.keep_per_printer is not None:
+            printer = archive.printer_id
+            self.per_printer[printer] = self.per_printer.get(printer, 0) + 1
+            if self.per_printer[printer] > self.keep_per_printer:
+                affected = True
+        if self.keep_favorites and archive.favorite:
+            # kept anyway, but its size is accounted, so the budget holds for all kept archives
+            self.kept_bytes += archive.file_size
+            return False
+        if self.max_bytes is not None and not affected:
+            if self.kept_bytes + archive.file_size > self.max_bytes:
+                affected = True
+            else:
+                self.kept_bytes += archive.file_size
+        return affected
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        keep_days=dict(type="int", required=False, default=None),
+        keep_per_printer=dict(type="int", required=False, default=None),
+        max_size_mb=dict(type="float", required=False, default=None),
+        action=dict(
+            type="str", required=False, default="delete", choices=["delete", "photos"]
+        ),
+        keep_favorites=dict(type="bool", required=False, default=True),
+        page_size=dict(type="int", required=False, default=100),
+        batch_size=dict(type="int", required=False, default=100),
+        workers=dict(type="int", required=False, default=4),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        archives=0,
+        photos=0,
+        freed_bytes=0,
+        ids=list(),
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        required_one_of=[("keep_days", "keep_per_printer", "max_size_mb")],
+        supports_check_mode=True,
+    )
+
+    try:
+        url = module.params["url"]
+        action = module.params["action"]
+        for option in ["page_size", "batch_size", "workers"]:
+            if module.params[option] < 1:
+                module.fail_json(msg=f"'{option}' needs to be at least 1", **result)
+        for option in ["keep_days", "keep_per_printer", "max_size_mb"]:
+            if module.params[option] is not None and module.params[option] < 0:
+                module.fail_json(msg=f"'{option}' can't be negative", **result)
+        if action == "photos" and module.params["max_size_mb"] is not None:
+            module.fail_json(
+                msg="'max_size_mb' can't be used with action photos", **result
+            )
+
+        # listing and deletions change the archives, therefore the response cache isn't used
+        s = api.create_session(url, module.params["token"], cache=False)
+
+        planner = Planner(
+            keep_days=module.params["keep_days"],
+            keep_per_printer=module.params["keep_per_printer"],
+            max_size_mb=module.params["max_size_mb"],
+            keep_favorites=module.params["keep_favorites"],
+        )
+        try:
+            archives = [
+                summarize(a)
+                for a in api.iterate(
+                    s, url, "archive", page_size=module.params["page_size"]
+                )
+            ]
+        except api.APIError as e:
+            module.fail_json(msg=str(e), response=e.response, **result)
+
+        jobs = list()
+        for archive in newest_first(archives):
+            if not planner.affected(archive):
+                continue
+            if action == "delete":
+                jobs.append((archive.id, None))
+                result["freed_bytes"] += archive.file_size
+                result["photos"] += len(archive.photos)
+            else:
+                if len(archive.photos) == 0:
+                    continue
+                jobs.extend((archive.id, name) for name in archive.photos)
+                result["photos"] += len(archive.photos)
+            result["ids"].append(archive.id)
+
+        result["archives"] = len(result["ids"])
+        result["changed"] = len(jobs) > 0
+
+        if not result["changed"]:
+            module.exit_json(msg="no archives affected", **result)
+        if module.check_mode:
+            module.exit_json(msg="would have applied retention", **result)
+
+        path = api.ENDPOINTS["archive"][0]
+
+        def apply(job):
+            archive_id, photo = job
+            if photo is None:
+                what = f"archive {archive_id}"
+                response = s.delete(f"{url}{path}{archive_id}")
+            else:
+                what = f"photo {photo} of archive {archive_id}"
+                response = s.delete(url + PHOTO_ENDPOINT % (archive_id, photo))
+            # already gone is fine as well
+            if response.status_code not in [200, 204, 404]:
+                return f"error on deleting {what}: {response.text}"
+            return None
+
+        size = module.params["batch_size"]
+        for start in range(0, len(jobs), size):
+            end = start + size
+            errors = [
+                e
+                for e in api.parallel(apply, jobs[start:end], module.params["workers"])
+                if e is not None
+            ]
+            if len(errors) > 0:
+                module.fail_json(
+                    msg="error on applying retention, remaining batches skipped",
+                    errors=errors,
+                    **result,
+                )
+
+        module.exit_json(msg="applied retention", **result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "retention")
+
+
+if __name__ == "__main__":
+    main()
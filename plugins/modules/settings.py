@@ -8,9 +8,12 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 from copy import deepcopy
 
-import requests
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    api,
+    models,
+    profiling,
+)
 
 
 DOCUMENTATION = r"""
@@ -271,10 +274,7 @@ def run_module():
     try:
         url = module.params["url"]
 
-        s = requests.Session()
-        s.headers["Content-Type"] = "application/json"
-        if module.params["token"] is not None and not module.params["token"] == "":
-            s.headers["Authorization"] = "Bearer %s" % module.params["token"]
+        s = api.create_session(url, module.params["token"])
 
         response = s.get(url + "/api/v1/settings/")
         if not response.status_code == 200:
@@ -283,6 +283,7 @@ def run_module():
                 response=response.text,
                 **result,
             )
+        current = models.Settings.from_response(response)
 
         data = deepcopy(module.params)
         data.pop("url", None)
@@ -290,13 +291,7 @@ def run_module():
         if data["external_url"] is None:
             data["external_url"] = url
 
-        update_required = False
-        for k, v in data.items():
-            if not response.json().get(k, None) == v:
-                update_required = True
-                break
-
-        if not update_required:
+        if current.matches(data):
             module.exit_json(msg="all settings configured as required", **result)
 
         result["changed"] = True
@@ -319,7 +314,7 @@ def run_module():
 
 
 def main():
-    run_module()
+    profiling.run(run_module, "settings")
 
 
 if __name__ == "__main__":
@@ -6,9 +6,9 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
-import requests
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, profiling
 
 
 DOCUMENTATION = r"""
@@ -25,6 +25,10 @@ description:
     - this modules executes the initial setup (first steps)
     - if a username and password is given, authentication is enabled and the corresponding admin user created
     - if username is left empty, authentication is disabled and the setup is marked as completed
+    - returns url and token like nils_ost.bambuddy.token does, so no additional login is required afterwards
+    - the token is taken from the setup response if it contains one, else a login is done with the configured user
+    - the token is added to the controller token cache, so nils_ost.bambuddy.token doesn't need to login again
+    - if setup was already completed and a user is given, a token is fetched like nils_ost.bambuddy.token does
 
 options:
     protocol:
@@ -71,14 +75,41 @@ EXAMPLES = r"""
   nils_ost.bambuddy.setup:
     host: "{{ ansible_host }}"
     user: admin
-    password "{{ bambuddy_password }}"
+    password: "{{ bambuddy_password }}"
+  delegate_to: localhost
+  register: bambuddy
+
+- name: configure settings with the token of setup
+  nils_ost.bambuddy.settings:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    currency: EUR
   delegate_to: localhost
 """
 
 RETURN = r"""
+url:
+    description:
+        - the URL build from protocol, host and port, to be used on other modules
+    type: str
+    returned: always
+    sample: 'http://192.168.0.6:8000'
+token:
+    description:
+        - API token of the configured user
+        - is null if user is null or in check mode if setup would be executed
+    type: str
+    returned: always
 """
 
 
+def fetch_token(module, url, user, password, result):
+    try:
+        return api.fetch_token(url, user, password)
+    except api.APIError as e:
+        module.fail_json(msg=str(e), **result)
+
+
 def run_module():
     # define available arguments/parameters a user can pass to the module
     module_args = dict(
@@ -96,6 +127,7 @@ def run_module():
     # for consumption, for example, in a subsequent task
     result = dict(
         changed=False,
+        token=None,
     )
 
     # the AnsibleModule object will be our abstraction working with Ansible
@@ -109,9 +141,12 @@ def run_module():
 
     try:
         url = f"{module.params['protocol']}://{module.params['host']}:{module.params['port']}"
+        result["url"] = url
+        user = module.params["user"]
+        password = module.params["password"]
+        with_user = user is not None and not user == ""
 
-        s = requests.Session()
-        s.headers["Content-Type"] = "application/json"
+        s = api.create_session(url, cache=False)
 
         response = s.get(url + "/api/v1/auth/status")
         if not response.status_code == 200:
@@ -122,6 +157,8 @@ def run_module():
             )
 
         if not response.json()["requires_setup"]:
+            if with_user and response.json().get("auth_enabled", True):
+                result["token"] = fetch_token(module, url, user, password, result)
             module.exit_json(msg="setup already completed", **result)
 
         result["changed"] = True
@@ -129,7 +166,7 @@ def run_module():
         if module.check_mode:
             module.exit_json(msg="would execute setup now", **result)
 
-        if module.params["user"] is None or module.params["user"] == "":
+        if not with_user:
             # just send a complete
             data = dict(
                 auth_enabled=False,
@@ -143,12 +180,12 @@ def run_module():
                 )
         else:
             # setup admin user
-            if module.params["password"] is None or module.params["password"] == "":
+            if password is None or password == "":
                 module.fail_json(msg="password required to create admin user", **result)
 
             data = dict(
-                admin_username=module.params["user"],
-                admin_password=module.params["password"],
+                admin_username=user,
+                admin_password=password,
                 auth_enabled=True,
             )
             response = s.post(url + "/api/v1/auth/setup", json=data)
@@ -159,6 +196,17 @@ def run_module():
                     **result,
                 )
 
+            # newer versions directly return a token for the admin user
+            try:
+                token = response.json().get("access_token")
+            except (ValueError, AttributeError):
+                token = None
+            if token is None:
+                token = fetch_token(module, url, user, password, result)
+            elif api.CACHE_ENABLED:
+                api.TokenCache().store(url, user, password, token)
+            result["token"] = token
+
         module.exit_json(msg="finished setup", **result)
 
     except Exception as e:
@@ -166,7 +214,7 @@ def run_module():
 
 
 def main():
-    run_module()
+    profiling.run(run_module, "setup")
 
 
 if __name__ == "__main__":
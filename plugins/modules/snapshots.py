@@ -0,0 +1,341 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import os
+import re
+import tempfile
+import threading
+import time
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    api,
+    output,
+    profiling,
+)
+
+
+try:
+    from PIL import Image
+except ImportError:
+    HAS_PIL = False
+    PIL_IMPORT_ERROR = traceback.format_exc()
+else:
+    HAS_PIL = True
+    PIL_IMPORT_ERROR = None
+
+
+DOCUMENTATION = r"""
+---
+module: snapshots
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: collect a camera snapshot of every printer
+
+description:
+    - Fetches one camera frame per printer through BamBuddy and writes it to a directory on the controller, e.g. for a status wall
+    - The printers are handled concurrently, by default with one worker per printer (up to 64), each printer has it's own timeout,
+      so all frames are fetched in about one timeout
+    - The status of every printer is fetched once, printers that are not connected are skipped without waiting for their camera
+    - Frames are streamed directly to disk, optionally a downscaled thumbnail is written next to them
+    - A printer whose frame couldn't be fetched is reported in failed, but doesn't fail the module
+
+requirements:
+    - Pillow (only if thumbnail_size is set)
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    dest:
+        description:
+            - directory the frames are written to, as C(<printer name>.jpg)
+            - the frames are readable according to the umask, e.g. by a web server
+            - characters of the printer name other than letters, digits, C(_), C(.) and C(-) are replaced by C(_),
+              the module fails if this results in the same file for multiple printers
+        required: true
+        type: path
+    printers:
+        description:
+            - names or ids of the printers to get a frame of
+            - if empty all printers are used
+        required: false
+        type: list
+        elements: str
+        default: []
+    skip_offline:
+        description:
+            - skip printers that are not connected according to their status
+        required: false
+        type: bool
+        default: true
+    workers:
+        description:
+            - maximum number of printers handled concurrently
+            - if ommited or set to null, one per printer up to 64
+        required: false
+        type: int
+        default: null
+    timeout:
+        description:
+            - seconds the status and the frame of one printer may take at most
+        required: false
+        type: float
+        default: 10
+    thumbnail_size:
+        description:
+            - if set, additionally a thumbnail (C(<printer name>.thumb.jpg)) is written, with it's longer edge being this many pixels
+        required: false
+        type: int
+        default: null
+"""
+
+EXAMPLES = r"""
+- name: refresh status wall
+  nils_ost.bambuddy.snapshots:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    dest: /var/www/wall/frames
+    timeout: 5
+    thumbnail_size: 320
+  delegate_to: localhost
+  register: snapshots
+"""
+
+RETURN = r"""
+snapshots:
+    description:
+        - the (to be) written frames
+    type: list
+    elements: dict
+    returned: always
+    sample: [{"printer": "printer1", "id": 1, "path": "/var/www/wall/frames/printer1.jpg", "bytes": 84211,
+              "thumbnail": "/var/www/wall/frames/printer1.thumb.jpg"}]
+skipped:
+    description:
+        - names of the printers skipped as they are not connected
+    type: list
+    elements: str
+    returned: always
+failed:
+    description:
+        - printers whose frame couldn't be fetched, with the error
+    type: list
+    elements: dict
+    returned: always
+    sample: [{"printer": "printer2", "id": 2, "error": "timeout after 10s"}]
+"""
+
+SNAPSHOT_ENDPOINT = "/api/v1/printers/%s/camera/snapshot"
+STATUS_ENDPOINT = "/api/v1/printers/%s/status"
+# upper bound of the default number of workers
+MAX_WORKERS = 64
+
+_local = threading.local()
+
+
+def thread_session(url, token):
+    # one session per worker, so connections are reused across the printers
+    if getattr(_local, "session", None) is None:
+        # frames and status change all the time, therefore the response cache isn't used
+        _local.session = api.create_session(url, token, cache=False)
+    return _local.session
+
+
+def file_name(name):
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+
+
+def write_thumbnail(path, size):
+    thumbnail = re.sub(r"\.jpg$", ".thumb.jpg", path)
+    with Image.open(path) as image:
+        image.thumbnail((size, size))
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            image.convert("RGB").save(f, "JPEG")
+    os.chmod(tmp, output.FILE_MODE)
+    os.replace(tmp, thumbnail)
+    return thumbnail
+
+
+def snapshot(job):
+    """
+    returns (state, details) with state being one of snapshot, skipped or failed
+    """
+    url, token, printer, params = job
+    entry = dict(printer=printer["name"], id=printer["id"])
+    deadline = time.monotonic() + params["timeout"]
+    session = thread_session(url, token)
+    try:
+        if params["skip_offline"]:
+            response = session.get(
+                url + STATUS_ENDPOINT % printer["id"], timeout=params["timeout"]
+            )
+            if not response.status_code == 200:
+                return "failed", dict(entry, error=response.text)
+            if not response.json().get("connected", False):
+                return "skipped", entry
+
+        entry["path"] = os.path.join(
+            params["dest"], file_name(printer["name"]) + ".jpg"
+        )
+        if params["check_mode"]:
+            return "snapshot", entry
+
+        response = session.get(
+            url + SNAPSHOT_ENDPOINT % printer["id"],
+            stream=True,
+            timeout=max(deadline - time.monotonic(), 0.1),
+        )
+        with response:
+            if not response.status_code == 200:
+                return "failed", dict(entry, error=response.text)
+            # the frame goes to a temporary file first, so a broken download never replaces the last good frame
+            fd, tmp = tempfile.mkstemp(dir=params["dest"], suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(65536):
+                        if time.monotonic() > deadline:
+                            raise TimeoutError(f"timeout after {params['timeout']}s")
+                        f.write(chunk)
+                entry["bytes"] = os.path.getsize(tmp)
+                os.chmod(tmp, output.FILE_MODE)
+                os.replace(tmp, entry["path"])
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+    except Exception as e:
+        return "failed", dict(entry, error=str(e))
+
+    if params["thumbnail_size"] is not None:
+        try:
+            entry["thumbnail"] = write_thumbnail(
+                entry["path"], params["thumbnail_size"]
+            )
+        except Exception as e:
+            return "failed", dict(entry, error=f"error on writing thumbnail: {e}")
+    return "snapshot", entry
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        dest=dict(type="path", required=True),
+        printers=dict(type="list", elements="str", required=False, default=list()),
+        skip_offline=dict(type="bool", required=False, default=True),
+        workers=dict(type="int", required=False, default=None),
+        timeout=dict(type="float", required=False, default=10),
+        thumbnail_size=dict(type="int", required=False, default=None),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        snapshots=list(),
+        skipped=list(),
+        failed=list(),
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    if module.params["thumbnail_size"] is not None and not HAS_PIL:
+        module.fail_json(msg=missing_required_lib("Pillow"), exception=PIL_IMPORT_ERROR)
+
+    try:
+        url = module.params["url"]
+        token = module.params["token"]
+        workers = module.params["workers"]
+        if workers is not None and workers < 1:
+            module.fail_json(msg="'workers' needs to be at least 1", **result)
+
+        session = api.create_session(url, token)
+        try:
+            printers = list(api.iterate(session, url, "printer"))
+        except api.APIError as e:
+            module.fail_json(msg=str(e), response=e.response, **result)
+        if module.params["printers"]:
+            wanted = set(module.params["printers"])
+            printers = [
+                p for p in printers if p["name"] in wanted or str(p["id"]) in wanted
+            ]
+            missing = (
+                wanted
+                - set(p["name"] for p in printers)
+                - set(str(p["id"]) for p in printers)
+            )
+            if missing:
+                module.fail_json(
+                    msg=f"unknown printers: {', '.join(sorted(missing))}", **result
+                )
+
+        # printers whose names differ only in replaced characters would overwrite each others frames
+        files = dict()
+        for p in printers:
+            files.setdefault(file_name(p["name"]), list()).append(p["name"])
+        collisions = [names for names in files.values() if len(names) > 1]
+        if collisions:
+            module.fail_json(
+                msg="printers would be written to the same file: "
+                + "; ".join(", ".join(names) for names in collisions),
+                **result,
+            )
+        if workers is None:
+            workers = min(max(len(printers), 1), MAX_WORKERS)
+
+        if not module.check_mode:
+            os.makedirs(module.params["dest"], exist_ok=True)
+
+        params = dict(module.params, check_mode=module.check_mode)
+        jobs = [(url, token, p, params) for p in printers]
+        for state, entry in api.parallel(snapshot, jobs, workers):
+            if state == "skipped":
+                result["skipped"].append(entry["printer"])
+            elif state == "failed":
+                result["failed"].append(entry)
+            else:
+                result["snapshots"].append(entry)
+
+        result["changed"] = len(result["snapshots"]) > 0
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "snapshots")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import csv
+import json
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, profiling
+
+
+DOCUMENTATION = r"""
+---
+module: spools
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: sync filament spool inventory
+
+description:
+    - Synchronizes the spool inventory of BamBuddy with a CSV, JSON or JSON lines file
+    - Rows are matched to existing spools by key, only spools that differ are updated
+    - Only the columns present in the file are compared and updated, all other spool values stay untouched
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    src:
+        description:
+            - path to the inventory file on the controller
+            - CSV needs a header line with the column names, empty cells are ignored
+            - JSON needs to be a list of objects, JSON lines one object per line
+        required: true
+        type: path
+    format:
+        description:
+            - format of src, auto detects it by the file extension (.csv, .json, .jsonl)
+        required: false
+        type: str
+        default: "auto"
+        choices: ["auto", "csv", "json", "jsonl"]
+    key:
+        description:
+            - column/attribute used to match rows to existing spools, needs to be unique
+        required: false
+        type: str
+        default: "tag_uid"
+    purge:
+        description:
+            - delete spools not contained in src
+        required: false
+        type: bool
+        default: false
+    workers:
+        description:
+            - maximum number of concurrent API requests for creates, updates and deletes
+        required: false
+        type: int
+        default: 4
+"""
+
+EXAMPLES = r"""
+# sync inventory from spreadsheet export
+- name: sync spools
+  nils_ost.bambuddy.spools:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    src: files/spools.csv
+    key: note
+    purge: true
+  delegate_to: localhost
+"""
+
+RETURN = r"""
+counts:
+    description:
+        - number of created, updated, deleted and unchanged spools
+    type: dict
+    returned: always
+    sample: {"created": 2, "updated": 1, "deleted": 0, "unchanged": 130}
+created:
+    description:
+        - keys of created spools
+    type: list
+    returned: always
+updated:
+    description:
+        - keys of updated spools
+    type: list
+    returned: always
+deleted:
+    description:
+        - keys of deleted spools
+    type: list
+    returned: always
+"""
+
+
+def read_rows(src, fmt):
+    if fmt == "auto":
+        fmt = src.rsplit(".", 1)[-1].lower()
+        if fmt not in ["csv", "json", "jsonl"]:
+            raise ValueError(f"can't detect format of {src}")
+    with open(src, "r", newline="") as f:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                yield {
+                    k: v for k, v in row.items() if k and v is not None and not v == ""
+                }
+        elif fmt == "jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for row in json.load(f):
+                yield row
+
+
+def _equal(current, expected):
+    # values from CSV are strings, they are compared as the type the API returns
+    if (
+        isinstance(expected, str)
+        and not isinstance(current, str)
+        and current is not None
+    ):
+        if isinstance(current, bool):
+            return str(current).lower() == expected.lower()
+        if isinstance(current, (int, float)):
+            try:
+                return float(current) == float(expected)
+            except ValueError:
+                return False
+    return current == expected
+
+
+def changed_values(spool, row, key):
+    return {
+        k: v
+        for k, v in row.items()
+        if k not in ["id", key] and not _equal(spool.get(k), v)
+    }
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        src=dict(type="path", required=True),
+        format=dict(
+            type="str",
+            required=False,
+            default="auto",
+            choices=["auto", "csv", "json", "jsonl"],
+        ),
+        key=dict(type="str", required=False, default="tag_uid", no_log=False),
+        purge=dict(type="bool", required=False, default=False),
+        workers=dict(type="int", required=False, default=4),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        counts=dict(created=0, updated=0, deleted=0, unchanged=0),
+        created=list(),
+        updated=list(),
+        deleted=list(),
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    try:
+        url = module.params["url"]
+        key = module.params["key"]
+
+        session = api.create_session(url, module.params["token"])
+
+        try:
+            index = dict()
+            for spool in api.iterate(session, url, "spool"):
+                if spool.get(key) is not None and not spool.get(key) == "":
+                    index[str(spool[key])] = spool
+        except api.APIError as e:
+            module.fail_json(msg=str(e), response=e.response, **result)
+
+        creates = list()
+        updates = list()
+        seen = set()
+        diff = dict(before=dict(), after=dict())
+        for number, row in enumerate(
+            read_rows(module.params["src"], module.params["format"]), start=1
+        ):
+            if row.get(key) is None or row.get(key) == "":
+                module.fail_json(
+                    msg=f"row {number} of src has no value for '{key}'", **result
+                )
+            k = str(row[key])
+            if k in seen:
+                module.fail_json(
+                    msg=f"'{key}' {k} is used multiple times in src", **result
+                )
+            seen.add(k)
+            spool = index.get(k)
+            if spool is None:
+                creates.append((k, row))
+                diff["after"][k] = row
+                continue
+            changes = changed_values(spool, row, key)
+            if len(changes) == 0:
+                result["counts"]["unchanged"] += 1
+                continue
+            updates.append((k, spool["id"], changes))
+            diff["before"][k] = {c: spool.get(c) for c in changes}
+            diff["after"][k] = changes
+
+        deletes = list()
+        if module.params["purge"]:
+            for k, spool in index.items():
+                if k not in seen:
+                    deletes.append((k, spool["id"]))
+                    diff["before"][k] = spool
+
+        result["created"] = [c[0] for c in creates]
+        result["updated"] = [u[0] for u in updates]
+        result["deleted"] = [d[0] for d in deletes]
+        result["counts"]["created"] = len(creates)
+        result["counts"]["updated"] = len(updates)
+        result["counts"]["deleted"] = len(deletes)
+        result["changed"] = len(creates) + len(updates) + len(deletes) > 0
+        if module._diff:
+            result["diff"] = diff
+
+        if not result["changed"]:
+            module.exit_json(msg="spools already as expected", **result)
+        if module.check_mode:
+            module.exit_json(msg="would have synced spools", **result)
+
+        path = api.ENDPOINTS["spool"][0]
+
+        def apply(change):
+            action, args = change
+            if action == "create":
+                response = session.post(url + path, json=args[1])
+            elif action == "update":
+                response = session.patch(f"{url}{path}/{args[1]}", json=args[2])
+            else:
+                response = session.delete(f"{url}{path}/{args[1]}")
+            if not response.status_code == 200:
+                return f"error on {action} of spool {args[0]}: {response.text}"
+            return None
+
+        changes = (
+            [("create", c) for c in creates]
+            + [("update", u) for u in updates]
+            + [("delete", d) for d in deletes]
+        )
+        errors = [
+            e
+            for e in api.parallel(apply, changes, module.params["workers"])
+            if e is not None
+        ]
+        if len(errors) > 0:
+            module.fail_json(msg="error on syncing spools", errors=errors, **result)
+
+        module.exit_json(msg="synced spools", **result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "spools")
+
+
+if __name__ == "__main__":
+    main()
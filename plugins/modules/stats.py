@@ -0,0 +1,486 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import hashlib
+import json
+import os
+import tempfile
+
+from datetime import datetime, timedelta, timezone
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    api,
+    models,
+    profiling,
+)
+
+
+DOCUMENTATION = r"""
+---
+module: stats
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: aggregate print statistics from archives
+
+description:
+    - Pages through the print archives and aggregates number of prints, print hours, filament and energy usage and their costs
+    - Archives are aggregated while they are fetched, so the archives are never held in memory as a whole
+    - Costs missing on an archive are calculated with default_filament_cost and energy_cost_per_kwh of the settings
+    - The aggregates of closed time windows (e.g. past months) are cached on the controller,
+      following runs only fetch archives newer than the last cached window
+    - The paging stops as soon as a whole page of archives is older than required, as long as the archives are returned newest first
+      (ids descending), if they are not all archives are paged through
+    - Cached windows don't notice deleted archives (e.g. by nils_ost.bambuddy.retention), use rebuild_cache after deleting archives
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    period:
+        description:
+            - length of the time windows the archives are aggregated in
+            - with none all archives are aggregated into the window C(all)
+        required: false
+        type: str
+        choices: ["day", "week", "month", "year", "none"]
+        default: month
+    group_by:
+        description:
+            - properties the archives are grouped by within a time window, multiple properties are joined by C(/)
+            - if empty all archives of a window are aggregated into the group C(all)
+        required: false
+        type: list
+        elements: str
+        choices: ["printer", "location", "model", "filament_type", "status"]
+        default: ["printer"]
+    since:
+        description:
+            - date (YYYY-MM-DD) of the first time window to be returned, the window containing this date is returned completely
+            - if ommited all archives are aggregated
+        required: false
+        type: str
+        default: null
+    until:
+        description:
+            - date (YYYY-MM-DD) of the last time window to be returned, the window containing this date is returned completely
+        required: false
+        type: str
+        default: null
+    page_size:
+        description:
+            - number of archives fetched per request
+        required: false
+        type: int
+        default: 100
+    cache:
+        description:
+            - cache the aggregates of closed time windows on the controller and reuse them on following runs
+        required: false
+        type: bool
+        default: true
+    rebuild_cache:
+        description:
+            - ignore the cached aggregates and replace them by the ones of this run, e.g. after archives were deleted
+        required: false
+        type: bool
+        default: false
+"""
+
+EXAMPLES = r"""
+# monthly statistics per location of this year
+- name: aggregate statistics
+  nils_ost.bambuddy.stats:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    group_by:
+      - location
+    since: "2026-01-01"
+  delegate_to: localhost
+  register: stats
+
+# the cached aggregates of past months contain archives deleted by retention, rebuild them
+- name: apply archive retention
+  nils_ost.bambuddy.retention:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    keep_days: 365
+  delegate_to: localhost
+  register: retention
+
+- name: aggregate statistics
+  nils_ost.bambuddy.stats:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    rebuild_cache: "{{ retention.changed }}"
+  delegate_to: localhost
+  register: stats
+
+- name: show filament costs of last month
+  ansible.builtin.debug:
+    msg: "{{ stats.stats['2026-09'] | dict2items | map(attribute='value.filament_cost') | sum }} {{ stats.currency }}"
+"""
+
+RETURN = r"""
+stats:
+    description:
+        - aggregates by time window and group
+        - every aggregate contains prints, completed, failed, print_hours, filament_grams, filament_cost, energy_kwh and energy_cost
+    type: dict
+    returned: always
+    sample: {"2026-09": {"basement": {"prints": 12, "completed": 11, "failed": 1, "print_hours": 40.5, "filament_grams": 1830.2,
+             "filament_cost": 45.76, "energy_kwh": 9.1, "energy_cost": 2.28}}}
+currency:
+    description:
+        - currency of the costs, as configured in settings
+    type: str
+    returned: always
+fetched:
+    description:
+        - number of archives fetched from the API
+    type: int
+    returned: always
+cached_windows:
+    description:
+        - number of time windows taken from the controller cache
+    type: int
+    returned: always
+"""
+
+CACHE_DIR = os.environ.get(
+    "BAMBUDDY_STATS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "nils_ost.bambuddy", "stats"),
+)
+VALUES = [
+    "prints",
+    "completed",
+    "failed",
+    "print_hours",
+    "filament_grams",
+    "filament_cost",
+    "energy_kwh",
+    "energy_cost",
+]
+
+
+def parse_time(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+    t = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if t.tzinfo is None:
+        t = t.replace(tzinfo=timezone.utc)
+    return t
+
+
+def window_start(t, period):
+    t = t.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "week":
+        return t - timedelta(days=t.weekday())
+    if period == "month":
+        return t.replace(day=1)
+    if period == "year":
+        return t.replace(month=1, day=1)
+    return t
+
+
+def window_key(t, period):
+    # keys sort in chronological order
+    if period == "day":
+        return t.strftime("%Y-%m-%d")
+    if period == "week":
+        year, week = t.isocalendar()[:2]
+        return "%d-W%02d" % (year, week)
+    if period == "month":
+        return t.strftime("%Y-%m")
+    if period == "year":
+        return t.strftime("%Y")
+    return "all"
+
+
+def archive_time(archive):
+    for field in ["completed_at", "started_at", "created_at"]:
+        t = parse_time(archive.get(field))
+        if t is not None:
+            return t
+    return None
+
+
+def group_key(archive, printer, group_by):
+    if not group_by:
+        return "all"
+    values = list()
+    for prop in group_by:
+        if prop == "printer":
+            value = printer.name if printer is not None else archive.get("printer_id")
+        elif prop in ["location", "model"]:
+            value = getattr(printer, prop) if printer is not None else None
+        else:
+            value = archive.get(prop)
+        values.append(str(value) if value not in [None, ""] else "unknown")
+    return "/".join(values)
+
+
+def add(aggregate, archive, settings):
+    grams = float(archive.get("filament_used_grams") or 0)
+    filament_cost = archive.get("cost")
+    if filament_cost is None:
+        filament_cost = grams / 1000 * float(settings.default_filament_cost or 0)
+    kwh = float(archive.get("energy_kwh") or 0)
+    energy_cost = archive.get("energy_cost")
+    if energy_cost is None:
+        energy_cost = kwh * float(settings.energy_cost_per_kwh or 0)
+    seconds = archive.get("print_time_seconds")
+    if seconds is None:
+        started = parse_time(archive.get("started_at"))
+        completed = parse_time(archive.get("completed_at"))
+        seconds = (completed - started).total_seconds() if started and completed else 0
+
+    aggregate["prints"] += 1
+    if archive.get("status") == "completed":
+        aggregate["completed"] += 1
+    elif archive.get("status") in ["failed", "cancelled", "aborted"]:
+        aggregate["failed"] += 1
+    aggregate["print_hours"] += float(seconds) / 3600
+    aggregate["filament_grams"] += grams
+    aggregate["filament_cost"] += float(filament_cost)
+    aggregate["energy_kwh"] += kwh
+    aggregate["energy_cost"] += float(energy_cost)
+
+
+class StatsCache:
+    """
+    aggregates of closed time windows, scanned_from is the start of the oldest window that was scanned
+    (null if all archives were scanned), closed_until is the start of the first window that wasn't closed yet
+    """
+
+    def __init__(self, url, key, path=None):
+        self.path = path or CACHE_DIR
+        key = json.dumps([url.rstrip("/"), key], sort_keys=True)
+        self.file = os.path.join(
+            self.path, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        )
+
+    def load(self):
+        try:
+            with open(self.file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, entry):
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, self.file)
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        period=dict(
+            type="str",
+            required=False,
+            default="month",
+            choices=["day", "week", "month", "year", "none"],
+        ),
+        group_by=dict(
+            type="list",
+            elements="str",
+            required=False,
+            default=["printer"],
+            choices=["printer", "location", "model", "filament_type", "status"],
+        ),
+        since=dict(type="str", required=False, default=None),
+        until=dict(type="str", required=False, default=None),
+        page_size=dict(type="int", required=False, default=100),
+        cache=dict(type="bool", required=False, default=True),
+        rebuild_cache=dict(type="bool", required=False, default=False),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        stats=dict(),
+        currency=None,
+        fetched=0,
+        cached_windows=0,
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    try:
+        url = module.params["url"]
+        period = module.params["period"]
+        group_by = module.params["group_by"]
+        page_size = module.params["page_size"]
+
+        if page_size < 1:
+            module.fail_json(msg="'page_size' needs to be at least 1", **result)
+        try:
+            since = parse_time(module.params["since"])
+            until = parse_time(module.params["until"])
+        except ValueError as e:
+            module.fail_json(msg=f"invalid date: {e}", **result)
+        if since is not None:
+            since = window_start(since, period)
+
+        s = api.create_session(url, module.params["token"])
+
+        response = s.get(url + "/api/v1/settings/")
+        if not response.status_code == 200:
+            module.fail_json(
+                msg="error fetching current settings",
+                response=response.text,
+                **result,
+            )
+        settings = models.Settings.from_response(response)
+        result["currency"] = settings.currency
+
+        response = s.get(url + "/api/v1/printers/")
+        if not response.status_code == 200:
+            module.fail_json(
+                msg="error fetching existing printers",
+                response=response.text,
+                **result,
+            )
+        printers = models.Printers.from_response(response)
+
+        # cached aggregates are only valid for the same grouping and costs
+        cache = None
+        entry = None
+        if module.params["cache"] and not period == "none":
+            cache = StatsCache(
+                url,
+                dict(
+                    period=period,
+                    group_by=group_by,
+                    default_filament_cost=settings.default_filament_cost,
+                    energy_cost_per_kwh=settings.energy_cost_per_kwh,
+                ),
+            )
+            entry = None if module.params["rebuild_cache"] else cache.load()
+            if entry is not None and entry["scanned_from"] is not None:
+                if since is None or since < parse_time(entry["scanned_from"]):
+                    entry = None
+
+        windows = dict()
+        cutoff = since
+        if entry is not None:
+            windows = entry["windows"]
+            result["cached_windows"] = len(windows)
+            cutoff = parse_time(entry["closed_until"])
+
+        now = datetime.now(timezone.utc)
+        current = window_key(now, period)
+        older = 0
+        # the order of the API isn't guaranteed, stopping early is only safe once the archives are seen coming newest first
+        newest_first = None
+        previous = None
+        try:
+            for archive in api.iterate(s, url, "archive", page_size=page_size):
+                result["fetched"] += 1
+                archive_id = archive.get("id")
+                if not isinstance(archive_id, int) or (
+                    previous is not None and archive_id > previous
+                ):
+                    newest_first = False
+                elif previous is not None and newest_first is None:
+                    newest_first = True
+                previous = archive_id
+                t = archive_time(archive)
+                if t is None:
+                    continue
+                if cutoff is not None and t < cutoff:
+                    # a whole page of older ones means there is nothing left
+                    older += 1
+                    if newest_first and older >= page_size:
+                        break
+                    continue
+                older = 0
+                # without time windows, until has to be applied on the archives themselves
+                if (
+                    period == "none"
+                    and until is not None
+                    and window_key(t, "day") > window_key(until, "day")
+                ):
+                    continue
+                window = windows.setdefault(window_key(t, period), dict())
+                printer = printers.get(id=archive.get("printer_id"))
+                aggregate = window.setdefault(
+                    group_key(archive, printer, group_by), dict.fromkeys(VALUES, 0)
+                )
+                add(aggregate, archive, settings)
+        except api.APIError as e:
+            module.fail_json(msg=str(e), response=e.response, **result)
+
+        if cache is not None:
+            cache.store(
+                dict(
+                    scanned_from=entry["scanned_from"]
+                    if entry is not None
+                    else (since.isoformat() if since is not None else None),
+                    closed_until=window_start(now, period).isoformat(),
+                    windows={k: v for k, v in windows.items() if k < current},
+                )
+            )
+
+        first = window_key(since, period) if since is not None else None
+        last = window_key(until, period) if until is not None else None
+        for key in sorted(windows.keys()):
+            if first is not None and key < first:
+                continue
+            if last is not None and key > last:
+                continue
+            result["stats"][key] = {
+                group: {
+                    k: round(v, 2) if isinstance(v, float) else v
+                    for k, v in values.items()
+                }
+                for group, values in windows[key].items()
+            }
+
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "stats")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,9 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
-import requests
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, profiling
 
 
 DOCUMENTATION = r"""
@@ -26,6 +26,7 @@ description:
     - this module fetches such tokens from your instance, by logging in with username and password
     - which then can be used for other modules in this collection
     - in case autehntication is not enabled, this module can be used to build the base URL for API instance, which can be handy in some circumstances
+    - tokens are cached on the controller, as long as a cached token is accepted by the instance no new login is done
 
 options:
     protocol:
@@ -58,6 +59,12 @@ options:
         required: false
         type: str
         default: null
+    cache:
+        description:
+            - reuse a cached token of a previous login (by this module or nils_ost.bambuddy.setup)
+        required: false
+        type: bool
+        default: true
 """
 
 EXAMPLES = r"""
@@ -95,6 +102,7 @@ def run_module():
         port=dict(type="int", required=False, default=8000),
         user=dict(type="str", required=False, default=None),
         password=dict(type="str", required=False, default=None, no_log=True),
+        cache=dict(type="bool", required=False, default=True),
     )
 
     # seed the result dict in the object
@@ -124,30 +132,16 @@ def run_module():
         if module.params["user"] is None or module.params["user"] == "":
             module.exit_json(**result)
 
-        headers = dict()
-        headers["Content-Type"] = "application/json"
-
-        data = dict(
-            username=module.params["user"],
-            password=module.params["password"],
-        )
-
-        response = requests.post(
-            result["url"] + "/api/v1/auth/login",
-            json=data,
-            headers=headers,
-        )
-
-        if not response.status_code == 200:
-            module.fail_json(
-                msg=f"error on fetching API token: {response.text}",
-                **result,
+        try:
+            result["token"] = api.fetch_token(
+                result["url"],
+                module.params["user"],
+                module.params["password"],
+                cache=module.params["cache"],
             )
+        except api.APIError as e:
+            module.fail_json(msg=str(e), **result)
 
-        if "access_token" not in response.json():
-            module.fail_json(msg="API response not containing a token", **result)
-
-        result["token"] = response.json().get("access_token")
         module.exit_json(**result)
 
     except Exception as e:
@@ -155,7 +149,7 @@ def run_module():
 
 
 def main():
-    run_module()
+    profiling.run(run_module, "token")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    profiling,
+    validation,
+)
+
+
+DOCUMENTATION = r"""
+---
+module: validate
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: validate data against a JSON schema
+
+description:
+    - Validates data against a JSON schema and reports all errors at once, each with the path of the invalid value
+    - Supports the commonly used subset of JSON Schema (type, enum, const, minimum, maximum, minLength, maxLength, pattern, required,
+      properties, patternProperties, additionalProperties, items, minItems, maxItems), unsupported keywords are reported as error
+    - Hashes of successfully validated data are remembered on the controller, unchanged data isn't validated again
+    - Doesn't require any additional collection or python library
+
+options:
+    data:
+        description:
+            - the data to be validated
+        required: true
+        type: raw
+    schema:
+        description:
+            - path of a JSON file containing the schema
+        required: true
+        type: path
+    name:
+        description:
+            - name of the data used as prefix of the paths in error messages
+        required: false
+        type: str
+        default: null
+    cache:
+        description:
+            - skip validation if the same data already passed validation against the same schema
+        required: false
+        type: bool
+        default: true
+"""
+
+EXAMPLES = r"""
+- name: Validate printers config
+  nils_ost.bambuddy.validate:
+    data: "{{ bambuddy_printers }}"
+    schema: "{{ role_path }}/criteria/bambuddy_printers.json"
+    name: bambuddy_printers
+  delegate_to: localhost
+"""
+
+RETURN = r"""
+errors:
+    description:
+        - all found errors with path of the invalid value and message
+    type: list
+    elements: dict
+    returned: always
+    sample: [{"path": "bambuddy_printers.printer1.model", "msg": "\"X9\" is not one of [\"X1C\", \"P1S\"]"}]
+skipped_validation:
+    description:
+        - true if the data already passed validation before and therefore wasn't validated again
+    type: bool
+    returned: always
+"""
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        data=dict(type="raw", required=True),
+        schema=dict(type="path", required=True),
+        name=dict(type="str", required=False, default=None),
+        cache=dict(type="bool", required=False, default=True),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        errors=list(),
+        skipped_validation=False,
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    try:
+        data = module.params["data"]
+        try:
+            schema = validation.load_schema(module.params["schema"])
+        except (OSError, ValueError) as e:
+            module.fail_json(msg=f"error loading schema: {e}", **result)
+
+        cache = validation.ValidationCache() if module.params["cache"] else None
+        if cache is not None and (schema, data) in cache:
+            result["skipped_validation"] = True
+            module.exit_json(**result)
+
+        try:
+            result["errors"] = validation.validate(data, schema, module.params["name"])
+        except validation.SchemaError as e:
+            module.fail_json(msg=f"invalid schema: {e}", **result)
+
+        if result["errors"]:
+            module.fail_json(
+                msg="validation failed: "
+                + "; ".join(f"{e['path']}: {e['msg']}" for e in result["errors"]),
+                **result,
+            )
+
+        if cache is not None:
+            cache.add(schema, data)
+
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "validate")
+
+
+if __name__ == "__main__":
+    main()
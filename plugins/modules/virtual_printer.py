@@ -6,9 +6,12 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
-import requests
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import (
+    api,
+    models,
+    profiling,
+)
 
 
 DOCUMENTATION = r"""
@@ -172,10 +175,7 @@ def run_module():
         url = module.params["url"]
         target_printer_id = None
 
-        s = requests.Session()
-        s.headers["Content-Type"] = "application/json"
-        if module.params["token"] is not None and not module.params["token"] == "":
-            s.headers["Authorization"] = "Bearer %s" % module.params["token"]
+        s = api.create_session(url, module.params["token"])
 
         if module.params["enabled"] and module.params["mode"] == "proxy":
             if module.params["target_printer_name"] == "":
@@ -191,15 +191,15 @@ def run_module():
                     response=response.text,
                     **result,
                 )
-            for printer in response.json():
-                if printer["name"] == module.params["target_printer_name"]:
-                    target_printer_id = printer["id"]
-                    break
-            if target_printer_id is None:
+            printer = models.Printers.from_response(response).get(
+                name=module.params["target_printer_name"]
+            )
+            if printer is None:
                 module.fail_json(
                     msg=f"could not find printer with name '{module.params['target_printer_name']}' for 'target_printer_name'",
                     **result,
                 )
+            target_printer_id = printer.id
 
         response = s.get(url + "/api/v1/settings/virtual-printer")
         if not response.status_code == 200:
@@ -209,16 +209,17 @@ def run_module():
                 **result,
             )
 
-        update_required = False
-        if not module.params["enabled"] == response.json()["enabled"]:
-            update_required = True
+        current = models.VirtualPrinterConfig.from_response(response)
+
+        desired = dict(enabled=module.params["enabled"])
         if module.params["enabled"]:
-            if not target_printer_id == response.json().get("target_printer_id", None):
-                update_required = True
-            for element in ["mode", "model", "remote_interface_ip"]:
-                if not module.params[element] == response.json().get(element, None):
-                    update_required = True
-                    break
+            desired.update(
+                target_printer_id=target_printer_id,
+                mode=module.params["mode"],
+                model=module.params["model"],
+                remote_interface_ip=module.params["remote_interface_ip"],
+            )
+        update_required = not current.matches(desired)
 
         if not update_required:
             module.exit_json(msg="configuration already as requested", **result)
@@ -256,7 +257,7 @@ def run_module():
 
 
 def main():
-    run_module()
+    profiling.run(run_module, "virtual_printer")
 
 
 if __name__ == "__main__":
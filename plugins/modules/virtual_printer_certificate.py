@@ -0,0 +1,269 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import glob
+import hashlib
+import json
+import os
+import re
+import ssl
+import tempfile
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import output, profiling
+
+
+DOCUMENTATION = r"""
+---
+module: virtual_printer_certificate
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: track virtual_printer CA certificates on the controller
+
+description:
+    - Remembers the virtual_printer CA certificate of every BamBuddy instance in a cache on the controller
+    - With just checksum given, only checks whether the certificate is already known, so the certificate has to be fetched
+      from the instance only if it is new or rotated
+    - With content given, the certificate is stored in the cache
+    - Optionally writes all cached certificates into a bundle file, ready to be distributed to the slicers
+    - Needs to be executed on the controller (delegate_to localhost)
+
+options:
+    instance:
+        description:
+            - name of the BamBuddy instance the certificate belongs to (e.g. inventory_hostname)
+        required: true
+        type: str
+    checksum:
+        description:
+            - sha1 checksum of the certificate file (as returned by ansible.builtin.stat)
+            - required if content is not set
+        required: false
+        type: str
+        default: null
+    content:
+        description:
+            - PEM content of the certificate, to be stored in the cache
+        required: false
+        type: str
+        default: null
+    bundle_file:
+        description:
+            - if set, all cached certificates are written into this file (on the controller)
+            - the file is only replaced if it's content changed
+            - the file is readable according to the umask, to be distributed to the slicers
+        required: false
+        type: path
+        default: null
+"""
+
+EXAMPLES = r"""
+- name: Check virtual_printer certificate
+  ansible.builtin.stat:
+    path: /opt/bambuddy/virtual_printer/certs/bbl_ca.crt
+  register: cert_file
+
+- name: Lookup certificate in cache
+  nils_ost.bambuddy.virtual_printer_certificate:
+    instance: "{{ inventory_hostname }}"
+    checksum: "{{ cert_file.stat.checksum }}"
+  delegate_to: localhost
+  register: cert_cache
+
+- name: Fetch certificate
+  ansible.builtin.slurp:
+    src: /opt/bambuddy/virtual_printer/certs/bbl_ca.crt
+  register: cert
+  when: not cert_cache.known
+
+- name: Store certificate
+  nils_ost.bambuddy.virtual_printer_certificate:
+    instance: "{{ inventory_hostname }}"
+    content: "{{ cert.content | b64decode }}"
+    bundle_file: /tmp/bambuddy_ca_bundle.crt
+  delegate_to: localhost
+  when: cert.content is defined
+"""
+
+RETURN = r"""
+known:
+    description:
+        - true if the certificate (identified by checksum or content) is already cached for this instance
+    type: bool
+    returned: always
+fingerprint:
+    description:
+        - SHA256 fingerprint of the certificate
+        - null if the certificate isn't known
+    type: str
+    returned: always
+    sample: "3A:1F:...:C2"
+certificate:
+    description:
+        - PEM content of the certificate
+        - null if the certificate isn't known
+    type: str
+    returned: always
+bundle_changed:
+    description:
+        - true if bundle_file was (or would have been) replaced
+    type: bool
+    returned: if bundle_file is set
+"""
+
+CACHE_DIR = os.environ.get(
+    "BAMBUDDY_CERT_CACHE_DIR",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "nils_ost.bambuddy", "certificates"
+    ),
+)
+
+
+def fingerprint(pem):
+    der = ssl.PEM_cert_to_DER_cert(pem)
+    digest = hashlib.sha256(der).hexdigest().upper()
+    return ":".join(re.findall("..", digest))
+
+
+class CertificateCache:
+    """
+    one file per instance holding checksum, fingerprint and PEM of the last known certificate
+    """
+
+    def __init__(self, path=None):
+        self.path = path or CACHE_DIR
+
+    def _file(self, instance):
+        return os.path.join(
+            self.path, hashlib.sha256(instance.encode("utf-8")).hexdigest() + ".json"
+        )
+
+    def load(self, instance):
+        try:
+            with open(self._file(instance), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, entry):
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, self._file(entry["instance"]))
+
+    def entries(self):
+        entries = list()
+        for path in glob.glob(os.path.join(self.path, "*.json")):
+            try:
+                with open(path, "r") as f:
+                    entries.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return sorted(entries, key=lambda e: e["instance"])
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        instance=dict(type="str", required=True),
+        checksum=dict(type="str", required=False, default=None),
+        content=dict(type="str", required=False, default=None),
+        bundle_file=dict(type="path", required=False, default=None),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        known=False,
+        fingerprint=None,
+        certificate=None,
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        required_one_of=[("checksum", "content")],
+        supports_check_mode=True,
+    )
+
+    try:
+        instance = module.params["instance"]
+        content = module.params["content"]
+        checksum = module.params["checksum"]
+        if content is not None:
+            # the checksum of the exact content, so it matches the one of the file (ansible.builtin.stat)
+            checksum = hashlib.sha1(content.encode("utf-8")).hexdigest()
+            content = content.replace("\r\n", "\n").strip() + "\n"
+
+        cache = CertificateCache()
+        entry = cache.load(instance)
+        if entry is not None and checksum in entry["checksums"]:
+            result["known"] = True
+        elif content is not None:
+            try:
+                fp = fingerprint(content)
+            except ValueError as e:
+                module.fail_json(msg=f"invalid certificate: {e}", **result)
+            if entry is not None and entry["fingerprint"] == fp:
+                # the same certificate in a differently formatted file, just its checksum is remembered
+                result["known"] = True
+                entry["checksums"].append(checksum)
+            else:
+                entry = dict(
+                    instance=instance,
+                    fingerprint=fp,
+                    checksums=[checksum],
+                    certificate=content,
+                )
+                result["changed"] = True
+            if not module.check_mode:
+                cache.store(entry)
+        else:
+            entry = None
+
+        if entry is not None:
+            result["fingerprint"] = entry["fingerprint"]
+            result["certificate"] = entry["certificate"]
+
+        if module.params["bundle_file"] is not None:
+            entries = {e["instance"]: e for e in cache.entries()}
+            if entry is not None:
+                entries[instance] = entry
+            with output.OutputFile(
+                module.params["bundle_file"], check_mode=module.check_mode
+            ) as out:
+                for name in sorted(entries.keys()):
+                    out.write("# BamBuddy virtual_printer CA of %s" % name)
+                    out.write("# SHA256 Fingerprint=%s" % entries[name]["fingerprint"])
+                    out.write(entries[name]["certificate"].rstrip("\n"))
+            result["bundle_changed"] = out.changed
+            result["changed"] = result["changed"] or out.changed
+
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "virtual_printer_certificate")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import json
+import re
+import time
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api, profiling
+
+
+try:
+    import websocket
+except ImportError:
+    HAS_WEBSOCKET = False
+    WEBSOCKET_IMPORT_ERROR = traceback.format_exc()
+else:
+    HAS_WEBSOCKET = True
+    WEBSOCKET_IMPORT_ERROR = None
+
+
+DOCUMENTATION = r"""
+---
+module: wait_for_state
+
+author: Nils Ost (@nils-ost)
+
+version_added: "1.2.0"
+
+short_description: wait for printers to reach a state
+
+description:
+    - Waits until the status of printers matches a condition, or fails if timeout is reached
+    - Subscribes to the live-update websocket of BamBuddy and evaluates the condition on every status update
+    - If the websocket can't be used, the status endpoints of the printers are polled with an exponential backoff
+
+requirements:
+    - websocket-client (optional, without it the status is polled)
+
+options:
+    url:
+        description:
+            - the full URL of API-Endpoint
+        required: true
+        type: str
+    token:
+        description:
+            - the token used for authentication on API-Endpoint
+            - if token is ommited or set to null, an anonymous API call is executed
+        required: false
+        type: str
+        default: null
+    printers:
+        description:
+            - names or ids of the printers to wait for
+            - if empty all printers are used
+        required: false
+        type: list
+        elements: str
+        default: []
+    condition:
+        description:
+            - fields of the printer status with their expected values
+            - if a list is given as value, one of the values needs to match
+        required: false
+        type: dict
+        default: {"connected": true}
+    match:
+        description:
+            - if the condition needs to hold for all printers or for any one of them
+        required: false
+        type: str
+        choices: ["all", "any"]
+        default: all
+    timeout:
+        description:
+            - seconds to wait at most
+        required: false
+        type: int
+        default: 300
+    transport:
+        description:
+            - how status updates are received
+            - auto uses the websocket if websocket-client is installed and the websocket can be connected, else polling
+            - websocket fails if the websocket can't be used
+            - if an established websocket connection gets lost, the status is polled for the remaining time
+        required: false
+        type: str
+        choices: ["auto", "websocket", "polling"]
+        default: auto
+    ws_path:
+        description:
+            - path of the live-update websocket
+        required: false
+        type: str
+        default: "/api/v1/ws"
+    delay:
+        description:
+            - seconds between the first two polls, doubled after every poll
+        required: false
+        type: float
+        default: 1
+    max_delay:
+        description:
+            - upper limit of seconds between two polls
+            - if the websocket is silent for this long, the status is polled once to not miss an update
+        required: false
+        type: float
+        default: 30
+"""
+
+EXAMPLES = r"""
+# wait for all printers to be connected
+- name: wait for printers
+  nils_ost.bambuddy.wait_for_state:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    timeout: 120
+  delegate_to: localhost
+
+# wait for one of two printers to be idle
+- name: wait for an idle printer
+  nils_ost.bambuddy.wait_for_state:
+    url: "{{ bambuddy.url }}"
+    token: "{{ bambuddy.token }}"
+    printers:
+      - printer1
+      - printer2
+    condition:
+      state: ["IDLE", "FINISH"]
+    match: any
+  delegate_to: localhost
+  register: idle
+
+- name: show idle printer
+  ansible.builtin.debug:
+    msg: "{{ idle.printers | dict2items | selectattr('value.state', 'in', ['IDLE', 'FINISH']) | map(attribute='key') | first }}"
+"""
+
+RETURN = r"""
+printers:
+    description:
+        - last known status of the printers by name
+    type: dict
+    returned: always
+    sample: {"printer1": {"connected": true, "state": "IDLE"}}
+transport:
+    description:
+        - how the status updates were received at last (websocket or polling)
+    type: str
+    returned: always
+elapsed:
+    description:
+        - seconds waited
+    type: float
+    returned: always
+"""
+
+STATUS_ENDPOINT = "/api/v1/printers/%s/status"
+
+
+def ws_url(url, path):
+    # http:// becomes ws:// and https:// becomes wss://
+    return re.sub(r"^http", "ws", url) + path
+
+
+def fetch_status(session, url, printer_id):
+    response = session.get(url + STATUS_ENDPOINT % printer_id)
+    if not response.status_code == 200:
+        return None
+    return response.json()
+
+
+def condition_met(states, condition, match):
+    results = [s is not None and api.matches(s, condition) for s in states.values()]
+    if match == "any":
+        return any(results)
+    return all(results)
+
+
+def run_module():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        url=dict(type="str", required=True),
+        token=dict(type="str", required=False, default=None, no_log=True),
+        printers=dict(type="list", elements="str", required=False, default=list()),
+        condition=dict(type="dict", required=False, default=dict(connected=True)),
+        match=dict(type="str", required=False, default="all", choices=["all", "any"]),
+        timeout=dict(type="int", required=False, default=300),
+        transport=dict(
+            type="str",
+            required=False,
+            default="auto",
+            choices=["auto", "websocket", "polling"],
+        ),
+        ws_path=dict(type="str", required=False, default="/api/v1/ws"),
+        delay=dict(type="float", required=False, default=1),
+        max_delay=dict(type="float", required=False, default=30),
+    )
+
+    # seed the result dict in the object
+    # we primarily care about changed and state
+    # changed is if this module effectively modified the target
+    # state will include any data that you want your module to pass back
+    # for consumption, for example, in a subsequent task
+    result = dict(
+        changed=False,
+        printers=dict(),
+        transport="polling",
+        elapsed=0.0,
+    )
+
+    # the AnsibleModule object will be our abstraction working with Ansible
+    # this includes instantiation, a couple of common attr would be the
+    # args/params passed to the execution, as well as if the module
+    # supports check mode
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    if module.params["transport"] == "websocket" and not HAS_WEBSOCKET:
+        module.fail_json(
+            msg=missing_required_lib("websocket-client"),
+            exception=WEBSOCKET_IMPORT_ERROR,
+        )
+
+    try:
+        url = module.params["url"]
+        token = module.params["token"]
+        condition = module.params["condition"]
+        match = module.params["match"]
+        started = time.monotonic()
+        deadline = started + module.params["timeout"]
+
+        # the status changes all the time, responses of the cache would be outdated
+        session = api.create_session(url, token, cache=False)
+
+        names = dict()
+        try:
+            for printer in api.iterate(session, url, "printer"):
+                names[printer["id"]] = printer["name"]
+        except api.APIError as e:
+            module.fail_json(msg=str(e), response=e.response, **result)
+        if module.params["printers"]:
+            wanted = set(module.params["printers"])
+            names = {k: v for k, v in names.items() if v in wanted or str(k) in wanted}
+            missing = wanted - set(names.values()) - set(str(k) for k in names.keys())
+            if missing:
+                module.fail_json(
+                    msg=f"unknown printers: {', '.join(sorted(missing))}", **result
+                )
+        if len(names) == 0:
+            module.fail_json(msg="no printers to wait for", **result)
+
+        states = dict.fromkeys(names.keys())
+
+        def poll():
+            for printer_id, status in zip(
+                names.keys(),
+                api.parallel(lambda i: fetch_status(session, url, i), names.keys()),
+            ):
+                states[printer_id] = status
+
+        def update_result():
+            result["printers"] = {names[k]: v for k, v in states.items()}
+            result["elapsed"] = round(time.monotonic() - started, 2)
+
+        ws = None
+        if not module.params["transport"] == "polling" and HAS_WEBSOCKET:
+            # connect before the first poll, so no update between poll and subscription is missed
+            try:
+                header = [f"Authorization: Bearer {token}"] if token else None
+                ws = websocket.create_connection(
+                    ws_url(url, module.params["ws_path"]),
+                    timeout=module.params["max_delay"],
+                    header=header,
+                )
+                result["transport"] = "websocket"
+            except Exception as e:
+                if module.params["transport"] == "websocket":
+                    module.fail_json(msg=f"error connecting websocket: {e}", **result)
+
+        poll()
+        delay = module.params["delay"]
+        try:
+            while not condition_met(states, condition, match):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    update_result()
+                    module.fail_json(
+                        msg="timeout waiting for printers to match condition", **result
+                    )
+
+                if ws is None:
+                    time.sleep(min(delay, remaining))
+                    delay = min(delay * 2, module.params["max_delay"])
+                    poll()
+                    continue
+
+                try:
+                    ws.settimeout(min(remaining, module.params["max_delay"]))
+                    message = ws.recv()
+                except websocket.WebSocketTimeoutException:
+                    # nothing received for a while, make sure no update got lost
+                    poll()
+                    continue
+                except Exception:
+                    ws = None
+                    result["transport"] = "polling"
+                    poll()
+                    continue
+
+                try:
+                    message = json.loads(message)
+                except ValueError:
+                    continue
+                if (
+                    not isinstance(message, dict)
+                    or not message.get("type") == "printer_status"
+                ):
+                    continue
+                printer_id = message.get("printer_id")
+                if printer_id in states and isinstance(message.get("data"), dict):
+                    states[printer_id] = dict(
+                        states[printer_id] or dict(), **message["data"]
+                    )
+        finally:
+            if ws is not None:
+                ws.close()
+
+        update_result()
+        module.exit_json(**result)
+
+    except Exception as e:
+        module.fail_json(msg=f"Error: {e}", **result)
+
+
+def main():
+    profiling.run(run_module, "wait_for_state")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api
+
+
+def entry():
+    return dict(url="http://bambuddy", etag=None, stored_at=0, body="[]")
+
+
+def test_store_and_invalidate(tmp_path):
+    cache = api.ResponseCache("http://bambuddy", path=str(tmp_path))
+    cache.store("key", entry(), cache.generation())
+    assert cache.load("key") is not None
+    cache.invalidate()
+    assert cache.load("key") is None
+
+
+def test_response_of_request_in_flight_during_invalidate_is_not_stored(tmp_path):
+    cache = api.ResponseCache("http://bambuddy", path=str(tmp_path))
+    # taken before the request is sent, another process writes and invalidates meanwhile
+    generation = cache.generation()
+    api.ResponseCache("http://bambuddy", path=str(tmp_path)).invalidate()
+    cache.store("key", entry(), generation)
+    assert cache.load("key") is None
@@ -0,0 +1,44 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+from ansible_collections.nils_ost.bambuddy.plugins.modules import facts
+
+
+def spec(parameters):
+    return {
+        "info": {"version": "0.2.0"},
+        "paths": {
+            "/api/v1/archives/": {
+                "get": {"parameters": [{"name": n, "in": "query"} for n in parameters]}
+            }
+        },
+    }
+
+
+def paged(parameters):
+    version, endpoints, features = facts.parse_openapi(spec(parameters))
+    return endpoints["archive"]["paged"]
+
+
+def test_paged_with_limit_and_offset():
+    assert paged(["limit", "offset"]) is True
+
+
+def test_not_paged_without_limit_and_offset():
+    assert paged(["printer_id"]) is False
+
+
+def test_paging_unknown_with_just_one_parameter():
+    # the flag of api.ENDPOINTS is kept, instead of stopping after the first page
+    assert paged(["limit"]) is None
+    assert paged(["offset"]) is None
+
+
+def test_unavailable_endpoint():
+    version, endpoints, features = facts.parse_openapi({"paths": {}})
+    assert endpoints["archive"] == dict(
+        path="/api/v1/archives/", available=False, paged=None
+    )
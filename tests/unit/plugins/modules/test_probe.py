@@ -0,0 +1,93 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+import json
+import re
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ansible_collections.nils_ost.bambuddy.plugins.module_utils import api
+from ansible_collections.nils_ost.bambuddy.plugins.modules import probe
+
+
+PRINTERS = 200
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """
+    read-only stand-in of the endpoints requested by probe
+    """
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/api/v1/printers/":
+            body = [dict(id=i, name="printer%d" % i) for i in range(1, PRINTERS + 1)]
+        elif path == "/api/v1/settings/":
+            body = dict(currency="EUR")
+        elif re.match(r"^/api/v1/printers/[0-9]+/status$", path):
+            body = dict(connected=True)
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def url(monkeypatch, tmp_path):
+    # no facts, no caches and a rate limit, which must not apply to the probe
+    monkeypatch.setattr(api, "facts", lambda url: None)
+    monkeypatch.setattr(api, "RATE_LIMIT", 1.0)
+    monkeypatch.setattr(api, "RATE_BURST", 1.0)
+    monkeypatch.setattr(api, "LIMIT_DIR", str(tmp_path))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def targets(url):
+    session = api.create_session(url, cache=False, limit=False)
+    paths = [
+        probe.STATUS_ENDPOINT.format(id=p["id"])
+        for p in api.iterate(session, url, "printer")
+    ]
+    return [
+        ("/api/v1/printers/", ["/api/v1/printers/"]),
+        ("/api/v1/settings/", ["/api/v1/settings/"]),
+        (probe.STATUS_ENDPOINT, paths),
+    ]
+
+
+def test_endpoints_are_weighted_equally(url):
+    samples, elapsed = probe.workload(url, None, targets(url), 4, 0.5, 5)
+    counts = dict()
+    for name, latency, success, size in samples:
+        assert success
+        counts[name] = counts.get(name, 0) + 1
+    assert len(counts) == 3
+    # every client takes turns over the endpoints, so the counts differ by at most one per client
+    assert max(counts.values()) - min(counts.values()) <= 4
+
+
+def test_rate_limit_is_not_applied(url):
+    samples, elapsed = probe.workload(url, None, targets(url), 2, 0.5, 5)
+    # with the limiter at most about one request per second would be possible
+    assert len(samples) > 10
+    assert probe.summarize([s[1:] for s in samples], elapsed)["errors"] == 0
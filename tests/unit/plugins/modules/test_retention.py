@@ -0,0 +1,59 @@
+# Copyright: (c) 2026, Nils Ost <@nils-ost>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+from ansible_collections.nils_ost.bambuddy.plugins.modules import retention
+
+
+def archives(count, printer_id=1, file_size=1024 * 1024):
+    # oldest first, as returned by a server listing by id ascending
+    return [
+        dict(
+            id=i,
+            created_at="2026-01-%02dT12:00:00Z" % i,
+            printer_id=printer_id,
+            file_size=file_size,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def affected(planner, items):
+    return [
+        a.id
+        for a in retention.newest_first(retention.summarize(i) for i in items)
+        if planner.affected(a)
+    ]
+
+
+def test_keep_per_printer_keeps_newest_of_oldest_first():
+    planner = retention.Planner(keep_per_printer=3)
+    assert sorted(affected(planner, archives(10))) == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_max_size_keeps_newest_of_oldest_first():
+    planner = retention.Planner(max_size_mb=2)
+    assert sorted(affected(planner, archives(5))) == [1, 2, 3]
+
+
+def test_unordered_archives():
+    items = archives(6)
+    items = items[3:] + items[:3]
+    planner = retention.Planner(keep_per_printer=2)
+    assert sorted(affected(planner, items)) == [1, 2, 3, 4]
+
+
+def test_favorites_count_towards_limits():
+    items = archives(4)
+    items[3]["is_favorite"] = True
+    planner = retention.Planner(keep_per_printer=2)
+    assert sorted(affected(planner, items)) == [1, 2]
+
+
+def test_archives_without_creation_time_are_kept():
+    items = archives(3)
+    items[0]["created_at"] = None
+    planner = retention.Planner(keep_per_printer=2)
+    assert affected(planner, items) == [2]